@@ -1,4 +1,4 @@
-backend/app/api/routes/websocket.py
+# backend/app/api/routes/websocket.py
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 from app.services.broadcast_service import BroadcastService
@@ -12,4 +12,4 @@ async def marquee_socket(websocket: WebSocket):
         while True:
             await websocket.receive_text()  # Keep alive
     except WebSocketDisconnect:
-        BroadcastService.unregister(websocket)
+        await BroadcastService.unregister(websocket)
@@ -32,6 +32,7 @@ class Settings(BaseSettings):
     # WebSocket and Redis
     WEBSOCKET_BROKER_CHANNEL: str = "broker_updates"
     REDIS_URL: str = os.getenv("REDIS_URL", "redis://localhost:6379")
+    BROADCAST_BACKEND: str = os.getenv("BROADCAST_BACKEND", "memory")  # "memory" or "redis"
 
     # Database
     DATABASE_URL: str = os.getenv("DATABASE_URL", "postgresql://postgres:password@db:5432/ultima")
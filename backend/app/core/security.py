@@ -9,7 +9,7 @@ from passlib.context import CryptContext
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 
-from app.db.database import SessionLocal
+from app.db.database import AsyncSessionLocal
 from app.db.crud import get_user_by_username
 from app.db.models import User as DBUser
 
@@ -39,15 +39,12 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 # === USER FETCH ===
-def get_user(username: str) -> Optional[DBUser]:
-    db = SessionLocal()
-    try:
-        return get_user_by_username(db, username)
-    finally:
-        db.close()
+async def get_user(username: str) -> Optional[DBUser]:
+    async with AsyncSessionLocal() as db:
+        return await get_user_by_username(db, username)
 
 # === AUTH VALIDATOR ===
-def get_current_user(token: str = Depends(oauth2_scheme)) -> DBUser:
+async def get_current_user(token: str = Depends(oauth2_scheme)) -> DBUser:
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Invalid authentication credentials",
@@ -62,7 +59,7 @@ def get_current_user(token: str = Depends(oauth2_scheme)) -> DBUser:
         print(f"[Security] JWT decode error: {e}")
         raise credentials_exception
 
-    user = get_user(username)
+    user = await get_user(username)
     if not user or not user.is_active:
         raise credentials_exception
     return user
@@ -4,6 +4,6 @@ Database package initializer for Ultima Bot.
 Provides SQLAlchemy Base, session handling, and CRUD/model imports.
 """
 
-from .database import Base, SessionLocal, get_db
-from . import models  # SQLAlchemy models (e.g., User)
+from .database import Base, AsyncSessionLocal, get_db, init_db, close_db
+from . import models  # SQLAlchemy models (e.g., User, Trade)
 from . import crud    # Reusable DB access functions
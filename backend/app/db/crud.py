@@ -1,14 +1,16 @@
 # backend/app/db/crud.py
 
-from sqlalchemy.orm import Session
-from typing import Optional
-from app.db.models import User
+from sqlalchemy import bindparam, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+from app.db.models import Trade, User
 from app.core import schemas, security
 
-def get_user_by_username(db: Session, username: str) -> Optional[User]:
-    return db.query(User).filter(User.username == username).first()
+async def get_user_by_username(db: AsyncSession, username: str) -> Optional[User]:
+    result = await db.execute(select(User).where(User.username == username).limit(1))
+    return result.scalars().first()
 
-def create_user(db: Session, user_in: schemas.UserCreate, is_admin: bool = False) -> User:
+async def create_user(db: AsyncSession, user_in: schemas.UserCreate, is_admin: bool = False) -> User:
     hashed_password = security.get_password_hash(user_in.password)
     db_user = User(
         username=user_in.username,
@@ -19,6 +21,40 @@ def create_user(db: Session, user_in: schemas.UserCreate, is_admin: bool = False
         is_admin=is_admin
     )
     db.add(db_user)
-    db.commit()
-    db.refresh(db_user)
+    await db.commit()
+    await db.refresh(db_user)
     return db_user
+
+async def insert_trade(db: AsyncSession, trade_record: dict) -> Trade:
+    db_trade = Trade(**trade_record)
+    db.add(db_trade)
+    await db.commit()
+    return db_trade
+
+async def update_trade(db: AsyncSession, trade_id: str, update_fields: dict):
+    await db.execute(update(Trade).where(Trade.trade_id == trade_id).values(**update_fields))
+    await db.commit()
+
+async def insert_trades(db: AsyncSession, trade_records: List[dict]):
+    """
+    Multi-row INSERT of trade records sharing the same keys.
+    """
+    await db.execute(insert(Trade.__table__), trade_records)
+    await db.commit()
+
+async def update_trades(db: AsyncSession, updates: List[dict]):
+    """
+    Batched UPDATE keyed on `trade_id`; every row must carry the same fields.
+    """
+    # Remaining keys become the SET clause; trade_id is renamed so it only binds the WHERE
+    rows = [{"b_trade_id": row["trade_id"], **{k: v for k, v in row.items() if k != "trade_id"}} for row in updates]
+    table = Trade.__table__
+    await db.execute(update(table).where(table.c.trade_id == bindparam("b_trade_id")), rows)
+    await db.commit()
+
+async def get_trade_history(db: AsyncSession, symbol: Optional[str] = None) -> List[Trade]:
+    query = select(Trade).order_by(Trade.timestamp_opened.desc())
+    if symbol:
+        query = query.where(Trade.symbol == symbol)
+    result = await db.execute(query)
+    return list(result.scalars().all())
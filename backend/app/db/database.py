@@ -1,26 +1,61 @@
 # backend/app/db/database.py
 
 import os
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, declarative_base, Session
-from typing import Generator
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import declarative_base
+from typing import AsyncGenerator
 
 # Load the database URL from environment variables or fallback
 DATABASE_URL = os.getenv("DATABASE_URL", "postgresql://postgres:password@db:5432/ultima")
 
-# Create SQLAlchemy engine with connection pooling
-engine = create_engine(DATABASE_URL, pool_pre_ping=True)
 
-# Configure session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+def _async_url(url: str) -> str:
+    """
+    Route plain postgres URLs through the asyncpg driver.
+    """
+    for prefix in ("postgresql://", "postgres://"):
+        if url.startswith(prefix):
+            return "postgresql+asyncpg://" + url[len(prefix):]
+    return url
+
+
+# Pool sizing: the API, trading loop and websocket fan-out share one event loop and one pool
+POOL_SIZE = int(os.getenv("DB_POOL_SIZE", 10))
+MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", 20))
+POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", 10))
+POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", 1800))
+
+# Create async SQLAlchemy engine with connection pooling
+engine = create_async_engine(
+    _async_url(DATABASE_URL),
+    pool_size=POOL_SIZE,
+    max_overflow=MAX_OVERFLOW,
+    pool_timeout=POOL_TIMEOUT,
+    pool_recycle=POOL_RECYCLE,
+    pool_pre_ping=True,
+)
+
+# Configure session factory; objects stay readable after commit without a reload round-trip
+AsyncSessionLocal = async_sessionmaker(engine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
 
 # Base class for models
 Base = declarative_base()
 
 # Dependency to get DB session for FastAPI routes
-def get_db() -> Generator[Session, None, None]:
-    db = SessionLocal()
-    try:
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
+
+
+async def init_db():
+    """
+    Create any missing tables.
+    """
+    from app.db import models  # noqa: F401 — register models on Base.metadata
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+
+async def close_db():
+    await engine.dispose()
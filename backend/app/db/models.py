@@ -1,6 +1,6 @@
 # backend/app/db/models.py
 
-from sqlalchemy import Column, Integer, String, Boolean
+from sqlalchemy import Column, Integer, String, Boolean, Float, DateTime, Index
 from sqlalchemy.orm import declarative_mixin
 from app.db.database import Base
 
@@ -17,3 +17,46 @@ class User(Base):
 
     def __repr__(self):
         return f"<User(username='{self.username}', email='{self.email}', admin={self.is_admin})>"
+
+
+class Trade(Base):
+    __tablename__ = "trades"
+    __table_args__ = (
+        Index("ix_trades_broker_status", "broker_id", "status"),
+        Index("ix_trades_symbol_opened", "symbol", "timestamp_opened"),
+    )
+
+    id = Column(Integer, primary_key=True)
+    trade_id = Column(String, unique=True, index=True, nullable=False)
+    symbol = Column(String, nullable=False)
+    side = Column(String, nullable=False)
+    status = Column(String, nullable=False, default="open")
+    broker_id = Column(String, nullable=True)
+    model_id = Column(String, nullable=True)
+    strategy_id = Column(String, nullable=True)
+
+    entry_price = Column(Float, nullable=True)
+    take_profit = Column(Float, nullable=True)
+    stop_loss = Column(Float, nullable=True)
+    confidence = Column(Float, nullable=True)
+    timestamp_opened = Column(DateTime, nullable=True)
+
+    # Capital allocation snapshot at entry
+    account_balance = Column(Float, nullable=True)
+    cash_available = Column(Float, nullable=True)
+    buying_power = Column(Float, nullable=True)
+    margin_balance = Column(Float, nullable=True)
+    margin_used = Column(Float, nullable=True)
+    margin_enabled = Column(Boolean, nullable=True)
+    margin_percent = Column(Float, nullable=True)
+    allocation_amount = Column(Float, nullable=True)
+
+    # Exit
+    exit_reason = Column(String, nullable=True)
+    exit_price = Column(Float, nullable=True)
+    timestamp_closed = Column(DateTime, nullable=True)
+    gain_dollar = Column(Float, nullable=True)
+    gain_pct = Column(Float, nullable=True)
+
+    def __repr__(self):
+        return f"<Trade(trade_id='{self.trade_id}', symbol='{self.symbol}', status='{self.status}')>"
@@ -1,6 +1,8 @@
 # backend/engines/auto_close_engine/__init__.py
 
 from .auto_close import AutoCloseEngine
+from .price_snapshot import PriceSnapshot
 from .trade_closer_loop import TradeCloserLoop
+from .trigger_index import TriggerIndex
 
-__all__ = ["AutoCloseEngine", "TradeCloserLoop"]
+__all__ = ["AutoCloseEngine", "PriceSnapshot", "TradeCloserLoop", "TriggerIndex"]
@@ -1,9 +1,11 @@
 # backend/app/engines/auto_close_engine/auto_close.py
 
 from datetime import datetime
-from typing import Dict, Any
+from typing import Any, Callable, Dict, Optional, Set
 from app.services.broadcast_service import BroadcastService
-from app.engines.trade_tracking.trade_summary import TradeSummary
+from app.engines.trade_tracking.trade_summary import trade_summary as default_trade_summary
+from app.engines.auto_close_engine.trigger_index import TriggerIndex
+from app.utils.bar_store import bar_store as default_bar_store
 
 
 class AutoCloseEngine:
@@ -15,16 +17,44 @@ class AutoCloseEngine:
         hero_mode_close_time: int = 60,
         trail_to_moon_buffer: float = 0.95,
         momentum_buffer: float = 0.02,
+        bar_store=None,
+        trade_summary=None,
+        on_close: Optional[Callable[[Dict[str, Any], Dict[str, Any]], None]] = None,
     ):
         self.broker_client = broker_client
+        self.bar_store = bar_store or default_bar_store
+        self.trade_summary = trade_summary or default_trade_summary
         self.confidence_floor = confidence_floor
         self.confidence_drop_threshold = confidence_drop_threshold
         self.hero_mode_close_time = hero_mode_close_time
         self.trail_to_moon_buffer = trail_to_moon_buffer
         self.momentum_buffer = momentum_buffer
 
-    async def evaluate_trade(self, trade: Dict[str, Any]):
-        current_price = await self.broker_client.get_price(trade['symbol'])
+        # on_close(trade, result) hands a closed trade back to its owner (e.g. TradeExecutor.remove_trade),
+        # which then records it; without one the close is recorded here
+        self.on_close = on_close
+
+        # Event-driven mode: trades indexed by their TP/SL/trail trigger levels
+        self.trigger_index = TriggerIndex()
+        self.tracked_trades: Dict[str, Dict[str, Any]] = {}
+
+        # Trades currently being evaluated; a trade is never evaluated twice concurrently
+        self.evaluating: Set[str] = set()
+
+    async def evaluate_trade(self, trade: Dict[str, Any], current_price: Optional[float] = None):
+        trade_id = trade['trade_id']
+        if trade_id in self.evaluating:
+            return
+
+        self.evaluating.add(trade_id)
+        try:
+            await self._evaluate(trade, current_price)
+        finally:
+            self.evaluating.discard(trade_id)
+
+    async def _evaluate(self, trade: Dict[str, Any], current_price: Optional[float] = None):
+        if current_price is None:
+            current_price = await self.broker_client.get_price(trade['symbol'])
 
         if await self._check_tp_sl(trade, current_price):
             return
@@ -62,9 +92,10 @@ class AutoCloseEngine:
     async def _trail_to_moon(self, trade: Dict[str, Any], current_price: float):
         activation_price = trade['forecast_tp'] * self.trail_to_moon_buffer
         if current_price >= activation_price:
-            atr = trade.get('atr', 0.5)
-            trail_distance = atr * 0.6
-            await self._apply_trailing_stop(trade, current_price, trail_distance)
+            await self._apply_trailing_stop(trade, current_price, self._trail_distance(trade))
+
+    def _trail_distance(self, trade: Dict[str, Any]) -> float:
+        return trade.get('atr', 0.5) * 0.6
 
     async def _apply_trailing_stop(self, trade: Dict[str, Any], current_price: float, trail_distance: float):
         side = trade['side']
@@ -88,7 +119,8 @@ class AutoCloseEngine:
         return (below_floor or drop_pct >= self.confidence_drop_threshold) and is_profitable and not has_momentum
 
     def _check_price_momentum(self, trade: Dict[str, Any], current_price: float) -> bool:
-        last_prices = trade.get('recent_prices', [])
+        series = self.bar_store.get(trade['symbol'])
+        last_prices = series.closes(3) if series is not None else trade.get('recent_prices', [])
         if len(last_prices) < 3:
             return False
         momentum = (current_price - last_prices[-3]) / last_prices[-3]
@@ -102,7 +134,59 @@ class AutoCloseEngine:
         is_profitable = current_price > trade['entry_price'] if trade['side'] == 'buy' else current_price < trade['entry_price']
         return elapsed >= self.hero_mode_close_time and is_profitable
 
+    # ----------------------
+    # Event-Driven Mode
+    # ----------------------
+    def track_trade(self, trade: Dict[str, Any]):
+        """
+        Register a trade in the trigger index so price ticks can close it.
+        """
+        self.tracked_trades[trade['trade_id']] = trade
+        upper, lower = self._trigger_levels(trade)
+        self.trigger_index.add(trade['trade_id'], trade['symbol'], upper, lower)
+
+    def untrack_trade(self, trade_id: str):
+        self.tracked_trades.pop(trade_id, None)
+        self.trigger_index.remove(trade_id)
+
+    def _trigger_levels(self, trade: Dict[str, Any]):
+        """
+        Returns (upper, lower): the nearest prices at or beyond which evaluate_trade would act.
+        """
+        tp, sl = trade['take_profit'], trade['stop_loss']
+
+        if trade['side'] == 'buy':
+            upper, lower = tp, sl
+            if trade.get('forecast_tp'):
+                activation_price = trade['forecast_tp'] * self.trail_to_moon_buffer
+                # The trailing stop only moves once price clears the current stop by the trail distance
+                trail_level = max(activation_price, sl + self._trail_distance(trade))
+                upper = min(upper, trail_level)
+            return upper, lower
+
+        upper, lower = sl, tp
+        if trade.get('forecast_tp'):
+            upper = min(upper, trade['forecast_tp'] * self.trail_to_moon_buffer)
+        return upper, lower
+
+    async def on_price_tick(self, symbol: str, price: float):
+        """
+        Evaluate only the trades on this symbol whose trigger levels the tick crossed.
+        """
+        for trade_id in self.trigger_index.crossed(symbol, price):
+            trade = self.tracked_trades.get(trade_id)
+            if not trade:
+                self.trigger_index.remove(trade_id)
+                continue
+
+            await self.evaluate_trade(trade, price)
+
+            # Closed trades are untracked by _close_and_broadcast; re-index the rest (stop may have trailed)
+            if trade_id in self.tracked_trades:
+                self.track_trade(trade)
+
     async def _close_and_broadcast(self, trade: Dict[str, Any], price: float, reason: str):
+        self.untrack_trade(trade['trade_id'])
         await self.broker_client.close_trade(trade['trade_id'], reason=reason)
 
         gain = (price - trade['entry_price']) if trade['side'] == 'buy' else (trade['entry_price'] - price)
@@ -116,9 +200,19 @@ class AutoCloseEngine:
             rationale=reason
         )
 
-        await TradeSummary().record_trade_close({
+        if self.on_close:
+            self.on_close(trade, {
+                "gain_pct": gain_pct,
+                "gain_usd": gain_usd,
+                "exit_price": price,
+                "reason": reason,
+            })
+            return
+
+        await self.trade_summary.record_trade_close({
             "symbol": trade['symbol'],
             "trade_id": trade['trade_id'],
+            "side": trade['side'],
             "mode": trade.get("mode"),
             "model_id": trade.get("model_id"),
             "strategy_id": trade.get("strategy_id"),
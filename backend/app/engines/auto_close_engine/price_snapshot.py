@@ -0,0 +1,67 @@
+# backend/app/engines/auto_close_engine/price_snapshot.py
+
+import asyncio
+from typing import Any, Dict, Iterable, List
+
+
+class PriceSnapshot:
+    """
+    Per-cycle price snapshot for one broker's open trades.
+    Each symbol is fetched once, from a fresh MarketDataHub quote when streaming, else
+    through the broker's multi-ticker endpoint (get_prices) when it has one, and the
+    quote is shared by every trade on that symbol.
+    """
+
+    def __init__(self, broker_client, market_data_hub=None, max_quote_age: float = 2.0, broker_id=None):
+        self.broker_client = broker_client
+        self.market_data_hub = market_data_hub
+        self.broker_id = broker_id  # Only use this broker's streamed quotes (any broker if None)
+        self.max_quote_age = max_quote_age
+        self.prices: Dict[str, float] = {}
+
+    @staticmethod
+    def group_by_symbol(trades: Iterable[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+        grouped: Dict[str, List[Dict[str, Any]]] = {}
+        for trade in trades:
+            grouped.setdefault(trade['symbol'], []).append(trade)
+        return grouped
+
+    async def refresh(self, trades: Iterable[Dict[str, Any]]) -> Dict[str, float]:
+        """
+        Replace the snapshot with fresh quotes for the symbols of the given trades.
+        """
+        symbols = list(self.group_by_symbol(trades))
+        prices: Dict[str, float] = {}
+
+        # Fresh streamed quotes need no REST call at all
+        if self.market_data_hub:
+            for symbol in symbols:
+                quote = self.market_data_hub.get_quote(symbol, max_age=self.max_quote_age, broker_id=self.broker_id)
+                if quote:
+                    prices[symbol] = quote.price
+
+        if hasattr(self.broker_client, "get_prices"):
+            try:
+                pending = [s for s in symbols if s not in prices]
+                if pending:
+                    quotes = await self.broker_client.get_prices(pending)
+                    prices.update({s: quotes[s] for s in pending if s in quotes})
+            except Exception as e:
+                print(f"[PriceSnapshot] Multi-ticker fetch failed: {e}")
+
+        # Fall back to one get_price per remaining unique symbol
+        missing = [s for s in symbols if s not in prices]
+        results = await asyncio.gather(
+            *(self.broker_client.get_price(s) for s in missing), return_exceptions=True
+        )
+        for symbol, result in zip(missing, results):
+            if isinstance(result, Exception):
+                print(f"[PriceSnapshot] Price fetch failed for {symbol}: {result}")
+                continue
+            prices[symbol] = result
+
+        self.prices = prices
+        return prices
+
+    def get(self, symbol: str):
+        return self.prices.get(symbol)
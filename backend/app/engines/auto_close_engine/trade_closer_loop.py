@@ -3,29 +3,126 @@
 import asyncio
 from typing import Dict
 from app.engines.auto_close_engine.auto_close import AutoCloseEngine
+from app.engines.auto_close_engine.price_snapshot import PriceSnapshot
 
 
 class TradeCloserLoop:
-    def __init__(self, broker_client, trade_executor):
+    # Max trades evaluated in parallel per broker (shared by every loop on that broker)
+    BROKER_CONCURRENCY = {
+        "default": 10,
+        "kraken": 5,
+        "robinhood": 5,
+    }
+    _semaphores: Dict[str, asyncio.Semaphore] = {}
+
+    def __init__(self, broker_client, trade_executor, event_driven: bool = False, evaluation_timeout: float = 10.0):
         self.broker_client = broker_client
         self.trade_executor = trade_executor
-        self.auto_close_engine = AutoCloseEngine(broker_client)
+        self.auto_close_engine = AutoCloseEngine(broker_client, on_close=self._on_trade_closed)
+        self.price_snapshot = PriceSnapshot(broker_client)
+        self.event_driven = event_driven
+        self.evaluation_timeout = evaluation_timeout
+        self.broker_id = None
+
+        # Keep the trigger index in step with the executor as trades open and close
+        trade_executor.open_listeners.append(self._on_trade_opened)
+        trade_executor.close_listeners.append(self.auto_close_engine.untrack_trade)
+
+    @classmethod
+    def _get_semaphore(cls, broker_id: str) -> asyncio.Semaphore:
+        if broker_id not in cls._semaphores:
+            limit = cls.BROKER_CONCURRENCY.get(broker_id, cls.BROKER_CONCURRENCY["default"])
+            cls._semaphores[broker_id] = asyncio.Semaphore(limit)
+        return cls._semaphores[broker_id]
 
-    async def monitor_trades(self, poll_interval: float = 5.0):
+    async def monitor_trades(self, poll_interval: float = 5.0, sweep_interval: float = 30.0):
         """
         Continuously evaluates open trades for closure using AutoCloseEngine.
+        In event-driven mode TP/SL/trailing exits fire from on_price_tick, so this loop
+        only reconciles the trigger index and sweeps time/confidence exits every sweep_interval.
         """
+        interval = sweep_interval if self.event_driven else poll_interval
         while True:
             open_trades: Dict[str, dict] = self.trade_executor.get_open_trades()
-            for trade_id, trade in list(open_trades.items()):
-                try:
-                    await self.auto_close_engine.evaluate_trade(trade)
-                except Exception as e:
-                    print(f"[AutoClose] Error evaluating trade {trade_id}: {e}")
-            await asyncio.sleep(poll_interval)
+            if self.event_driven:
+                self.sync_trades()
+
+            # One quote per symbol per cycle, shared by every trade on it
+            await self.price_snapshot.refresh(open_trades.values())
+            await asyncio.gather(*(
+                self._evaluate_trade(trade_id, trade)
+                for trade_id, trade in list(open_trades.items())
+            ))
+            await asyncio.sleep(interval)
+
+    async def _evaluate_trade(self, trade_id: str, trade: dict):
+        """
+        Evaluate one trade under its broker's concurrency cap and a per-trade timeout.
+        """
+        semaphore = self._get_semaphore(trade.get("broker_id", "default"))
+        try:
+            async with semaphore:
+                await asyncio.wait_for(
+                    self.auto_close_engine.evaluate_trade(trade, self.price_snapshot.get(trade['symbol'])),
+                    timeout=self.evaluation_timeout
+                )
+            # Re-index trades that stay open: the sweep may have trailed the stop
+            if self.event_driven and trade_id in self.auto_close_engine.tracked_trades:
+                self.auto_close_engine.track_trade(trade)
+        except asyncio.TimeoutError:
+            print(f"[AutoClose] Evaluation timed out for trade {trade_id}")
+        except Exception as e:
+            print(f"[AutoClose] Error evaluating trade {trade_id}: {e}")
+
+    def sync_trades(self):
+        """
+        Mirror the executor's open trades into the AutoCloseEngine trigger index.
+        Opens and closes are applied as they happen; this catches anything missed.
+        """
+        open_trades: Dict[str, dict] = self.trade_executor.get_open_trades()
+        for trade_id in list(self.auto_close_engine.tracked_trades):
+            if trade_id not in open_trades:
+                self.auto_close_engine.untrack_trade(trade_id)
+        for trade_id, trade in open_trades.items():
+            if trade_id not in self.auto_close_engine.tracked_trades:
+                self.auto_close_engine.track_trade(trade)
+
+    async def on_price_tick(self, symbol: str, price: float):
+        """
+        Entry point for streaming price feeds in event-driven mode.
+        """
+        try:
+            await self.auto_close_engine.on_price_tick(symbol, price)
+        except Exception as e:
+            print(f"[AutoClose] Error handling tick for {symbol}: {e}")
+
+    def attach_market_data(self, market_data_hub, broker_id=None):
+        """
+        Drive closes from a MarketDataHub: quotes become ticks, and streamed prices feed the snapshot.
+        With broker_id only that broker's quotes are used.
+        """
+        self.event_driven = True
+        self.sync_trades()
+        self.broker_id = broker_id
+        self.price_snapshot.market_data_hub = market_data_hub
+        self.price_snapshot.broker_id = broker_id
+        market_data_hub.subscribe(self._on_quote)
+
+    async def _on_quote(self, quote):
+        if self.broker_id and quote.broker != self.broker_id:
+            return
+        await self.on_price_tick(quote.symbol, quote.price)
+
+    def _on_trade_opened(self, trade: dict):
+        if self.event_driven:
+            self.auto_close_engine.track_trade(trade)
+
+    def _on_trade_closed(self, trade: dict, result: dict):
+        self.remove_trade(trade['trade_id'], result)
 
-    def remove_trade(self, trade_id: str):
+    def remove_trade(self, trade_id: str, result: dict = None):
         """
         Remove a trade from the executor tracking.
         """
-        self.trade_executor.remove_trade(trade_id)
+        self.auto_close_engine.untrack_trade(trade_id)
+        self.trade_executor.remove_trade(trade_id, result)
@@ -0,0 +1,95 @@
+# backend/app/engines/auto_close_engine/trigger_index.py
+
+from bisect import bisect_left, bisect_right
+from typing import Dict, List, Optional, Tuple
+
+
+class _SortedLevels:
+    """
+    Sorted (level, trade_id) pairs kept in two parallel lists so bisect works on plain floats.
+    """
+
+    def __init__(self):
+        self.levels: List[float] = []
+        self.trade_ids: List[str] = []
+
+    def add(self, level: float, trade_id: str):
+        idx = bisect_right(self.levels, level)
+        self.levels.insert(idx, level)
+        self.trade_ids.insert(idx, trade_id)
+
+    def remove(self, level: float, trade_id: str):
+        idx = bisect_left(self.levels, level)
+        while idx < len(self.levels) and self.levels[idx] == level:
+            if self.trade_ids[idx] == trade_id:
+                del self.levels[idx]
+                del self.trade_ids[idx]
+                return
+            idx += 1
+
+    def at_or_below(self, price: float) -> List[str]:
+        return self.trade_ids[:bisect_right(self.levels, price)]
+
+    def at_or_above(self, price: float) -> List[str]:
+        return self.trade_ids[bisect_left(self.levels, price):]
+
+    def __len__(self):
+        return len(self.levels)
+
+
+class TriggerIndex:
+    """
+    Per-symbol index of price trigger levels for open trades.
+
+    Each trade registers an upper level (fires when price >= level) and a lower
+    level (fires when price <= level). A tick only returns the trades whose
+    thresholds it crossed, so its cost does not depend on idle positions.
+    """
+
+    def __init__(self):
+        self.upper: Dict[str, _SortedLevels] = {}
+        self.lower: Dict[str, _SortedLevels] = {}
+        self.entries: Dict[str, Tuple[str, Optional[float], Optional[float]]] = {}
+
+    def add(self, trade_id: str, symbol: str, upper: Optional[float], lower: Optional[float]):
+        self.remove(trade_id)
+        if upper is not None:
+            self.upper.setdefault(symbol, _SortedLevels()).add(upper, trade_id)
+        if lower is not None:
+            self.lower.setdefault(symbol, _SortedLevels()).add(lower, trade_id)
+        self.entries[trade_id] = (symbol, upper, lower)
+
+    def remove(self, trade_id: str):
+        entry = self.entries.pop(trade_id, None)
+        if not entry:
+            return
+
+        symbol, upper, lower = entry
+        if upper is not None and symbol in self.upper:
+            self.upper[symbol].remove(upper, trade_id)
+            if not self.upper[symbol]:
+                del self.upper[symbol]
+        if lower is not None and symbol in self.lower:
+            self.lower[symbol].remove(lower, trade_id)
+            if not self.lower[symbol]:
+                del self.lower[symbol]
+
+    def crossed(self, symbol: str, price: float) -> List[str]:
+        """
+        Returns trade IDs whose upper or lower level was crossed by this price.
+        """
+        triggered = []
+        if symbol in self.upper:
+            triggered.extend(self.upper[symbol].at_or_below(price))
+        if symbol in self.lower:
+            triggered.extend(self.lower[symbol].at_or_above(price))
+        return list(dict.fromkeys(triggered))
+
+    def symbols(self) -> List[str]:
+        return list({symbol for symbol, _, _ in self.entries.values()})
+
+    def __contains__(self, trade_id: str):
+        return trade_id in self.entries
+
+    def __len__(self):
+        return len(self.entries)
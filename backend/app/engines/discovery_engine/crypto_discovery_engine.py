@@ -1,114 +1,160 @@
 # backend/app/engines/discovery_engine/crypto_discovery_engine.py
 
+import asyncio
+
 from app.engines.discovery_engine.market_data import CryptoMarketData
+from app.engines.discovery_engine.enrichment import fetch_all
+from app.engines.discovery_engine.filter_engine import crypto_table
+from app.engines.discovery_engine.strategy_rules import canonical_strategy_name, crypto_strategies
 
 class CryptoDiscoveryEngine:
+    TARGET_PER_STRATEGY = {
+        "CoinMarketCap": 8,
+        "Micro Cap Moonshot": 6,
+        "100X Volume Spike": 6,
+        "PumpFun_Trending": 5,
+        "GMGN_Trending": 5,
+        "Original": 5,
+        "Mid-Low Cap": 5,
+    }
+    DEFAULT_TARGET = 5  # For rule strategies registered without an explicit target
+
     def __init__(self, broker_client, strategy: str = None):
         self.broker_client = broker_client
         self.strategy = strategy
         self.market_data = CryptoMarketData(broker_client)
         self.liquidity_floor = 1_000_000  # Minimum volume filter
 
+        # Enrichment fan-out: max in-flight calls per source, and per-call timeout (seconds)
+        self.source_concurrency = {"symbol_data": 20, "cmc": 5}
+        self.enrichment_timeout = 10.0
+
     async def find_symbols(self):
         """
-        Run all discovery strategies and return a combined prioritized list of symbols.
+        Run all discovery strategies concurrently over one shared data snapshot
+        and return a combined prioritized list of symbols.
         """
-        target_per_strategy = {
-            "CoinMarketCap": 8,
-            "Micro Cap Moonshot": 6,
-            "100X Volume Spike": 6,
-            "PumpFun_Trending": 5,
-            "GMGN_Trending": 5,
-            "Original": 5,
-            "Mid-Low Cap": 5,
-        }
+        snapshot = await self._fetch_snapshot()
+        targets = dict(self.TARGET_PER_STRATEGY)
+        for strat in crypto_strategies.names():
+            targets.setdefault(strat, self.DEFAULT_TARGET)
+
+        strategies = list(targets)
+        results = await asyncio.gather(
+            *(self._discover_strategy(strat, snapshot) for strat in strategies), return_exceptions=True
+        )
 
         combined_symbols = []
-        for strat in target_per_strategy:
-            self.strategy = strat
-            symbols = await self._discover_strategy()
-            combined_symbols.extend(symbols[:target_per_strategy[strat]])
+        for strat, symbols in zip(strategies, results):
+            if isinstance(symbols, Exception):
+                print(f"[CryptoDiscoveryEngine] Strategy {strat} failed: {symbols}")
+                continue
+            combined_symbols.extend(symbols[:targets[strat]])
 
         return combined_symbols
 
-    async def _discover_strategy(self):
+    async def _fetch_snapshot(self):
+        """
+        Fetch the inputs shared by every strategy once per discovery pass.
+        A source that fails is treated as empty so the other strategies still run.
+        """
+        sources = {
+            "broker_symbols": (self.market_data.get_broker_symbols(volume_filter=True), []),
+            "cmc_new": (self.market_data.get_cmc_new_coins_filtered(), {}),
+            "cmc_trending": (self.market_data.get_cmc_trending_sorted(), {}),
+            "gmgn_trending": (self.market_data.get_gmgn_trending(), []),
+            "pumpfun_trending": (self.market_data.get_pumpfun_trending(), []),
+        }
+        results = await asyncio.gather(*(fetch for fetch, _ in sources.values()), return_exceptions=True)
+
+        snapshot = {}
+        for (name, (_, empty)), result in zip(sources.items(), results):
+            if isinstance(result, Exception):
+                print(f"[CryptoDiscoveryEngine] {name} fetch failed: {result}")
+                result = empty
+            snapshot[name] = result
+        return snapshot
+
+    async def _discover_strategy(self, strategy: str = None, snapshot: dict = None):
         """
-        Delegates symbol discovery to the appropriate strategy method.
+        Delegates symbol discovery to the appropriate strategy filter.
         """
-        if self.strategy == "CoinMarketCap":
-            return await self._discover_coinmarketcap()
-        elif self.strategy == "GMGN_Trending":
-            return await self._discover_gmgn_trending()
-        elif self.strategy == "PumpFun_Trending":
-            return await self._discover_pumpfun_trending()
-        elif self.strategy in ["Original", "100X Volume Spike", "Mid-Low Cap", "Micro Cap Moonshot"]:
-            return await self._discover_broker_based()
+        strategy = strategy or self.strategy
+        if snapshot is None:
+            snapshot = await self._fetch_snapshot()
+
+        key = canonical_strategy_name(strategy)
+        if key == "coinmarketcap":
+            return self._discover_coinmarketcap(snapshot)
+        elif key == "gmgntrending":
+            return self._discover_gmgn_trending(snapshot)
+        elif key == "pumpfuntrending":
+            return self._discover_pumpfun_trending(snapshot)
+        elif strategy in crypto_strategies:
+            return self._discover_broker_based(strategy, await self._get_table(snapshot))
         return []
 
-    async def _discover_coinmarketcap(self):
-        broker_symbols = await self.market_data.get_broker_symbols(volume_filter=True)
-        cmc_new = await self.market_data.get_cmc_new_coins_filtered()
-        cmc_trending = await self.market_data.get_cmc_trending_sorted()
+    def _discover_coinmarketcap(self, snapshot):
+        broker_symbols = set(snapshot["broker_symbols"])
 
         symbols = []
-        for source in [cmc_new, cmc_trending]:
+        for source in [snapshot["cmc_new"], snapshot["cmc_trending"]]:
             for symbol, data in source.items():
                 if data.get("volume_24h", 0) >= self.liquidity_floor and symbol in broker_symbols:
                     symbols.append(symbol)
         return symbols
 
-    async def _discover_gmgn_trending(self):
-        broker_symbols = await self.market_data.get_broker_symbols(volume_filter=True)
-        gmgn_trending = await self.market_data.get_gmgn_trending()
-        return [s for s in broker_symbols if s in gmgn_trending]
+    def _discover_gmgn_trending(self, snapshot):
+        gmgn_trending = set(snapshot["gmgn_trending"])
+        return [s for s in snapshot["broker_symbols"] if s in gmgn_trending]
 
-    async def _discover_pumpfun_trending(self):
-        broker_symbols = await self.market_data.get_broker_symbols(volume_filter=True)
-        pumpfun_trending = await self.market_data.get_pumpfun_trending()
-        return [s for s in broker_symbols if s in pumpfun_trending]
+    def _discover_pumpfun_trending(self, snapshot):
+        pumpfun_trending = set(snapshot["pumpfun_trending"])
+        return [s for s in snapshot["broker_symbols"] if s in pumpfun_trending]
 
-    async def _discover_broker_based(self):
-        broker_symbols = await self.market_data.get_broker_symbols(volume_filter=True)
-        results = []
+    async def _get_enriched(self, snapshot):
+        """
+        Per-symbol enrichment shared by all broker-based strategies; fetched once per snapshot.
+        """
+        if "enriched" not in snapshot:
+            snapshot["enriched"] = asyncio.ensure_future(self._enrich_symbols(snapshot["broker_symbols"]))
+        return await snapshot["enriched"]
+
+    async def _get_table(self, snapshot):
+        """
+        Columnar view of the enriched data, built once per snapshot for all broker-based strategies.
+        """
+        enriched = await self._get_enriched(snapshot)
+        if "table" not in snapshot:
+            snapshot["table"] = crypto_table(enriched)
+        return snapshot["table"]
 
+    async def _enrich_symbols(self, broker_symbols):
+        """
+        Prefetch symbol and CMC data for every symbol in parallel, capped per source.
+        """
+        symbol_data, cmc_data_map = await asyncio.gather(
+            fetch_all(broker_symbols, self.market_data.get_symbol_data,
+                      self.source_concurrency["symbol_data"], self.enrichment_timeout),
+            fetch_all(broker_symbols, self.market_data.get_cmc_symbol_data,
+                      self.source_concurrency["cmc"], self.enrichment_timeout),
+            return_exceptions=True,
+        )
+        if isinstance(symbol_data, Exception) or isinstance(cmc_data_map, Exception):
+            print(f"[CryptoDiscoveryEngine] Enrichment failed: {symbol_data if isinstance(symbol_data, Exception) else cmc_data_map}")
+            return {}
+
+        enriched = {}
         for symbol in broker_symbols:
-            try:
-                data = await self.market_data.get_symbol_data(symbol)
-                cmc_data = await self.market_data.get_cmc_symbol_data(symbol)
-                if not cmc_data or cmc_data.get("volume_24h", 0) < self.liquidity_floor:
-                    continue
-
-                # Filters
-                atr_pct = data["atr"] / data["price"] if data["price"] > 0 else 0
-                if atr_pct > 0.05:
-                    continue
-                if data.get("ema_5m", 0) <= data.get("ema_15m", 0):
-                    continue
-                if data.get("confidence", 0) < 0.95:
-                    continue
-
-                # Strategy-specific logic
-                if self.strategy == "Original":
-                    if data["volume"] > 500_000 and data["rsi"] > 55 and data["macd"] > 0:
-                        results.append(symbol)
-
-                elif self.strategy == "100X Volume Spike":
-                    if (data["volume_spike_5m"] >= 500_000 and data["recent_spike_candles"] <= 2 and
-                        data["rsi"] > 55 and data["macd"] > 0 and data["velocity"] > 0.03):
-                        results.append(symbol)
-
-                elif self.strategy == "Mid-Low Cap":
-                    market_cap = cmc_data.get("market_cap", 0)
-                    vol = cmc_data.get("volume_24h", 0)
-                    if market_cap <= 1_500_000 and data["volume"] > 300_000 and data["rsi"] > 55 and vol / market_cap > 0.5:
-                        results.append(symbol)
-
-                elif self.strategy == "Micro Cap Moonshot":
-                    if (cmc_data.get("market_cap", 0) <= 1_000_000 and
-                        data["volume_spike_5m"] >= 250_000 and data["atr"] > 0.01 and data["velocity"] > 0.05):
-                        results.append(symbol)
-
-            except Exception:
-                continue  # Continue safely on failure
-
-        return results
+            data = symbol_data.get(symbol)
+            cmc_data = cmc_data_map.get(symbol)
+            if not data or not cmc_data or cmc_data.get("volume_24h", 0) < self.liquidity_floor:
+                continue
+            enriched[symbol] = (data, cmc_data)
+        return enriched
+
+    def _discover_broker_based(self, strategy, table):
+        """
+        Evaluate the strategy's compiled rules over the symbol table.
+        """
+        return crypto_strategies.get(strategy).select(table)
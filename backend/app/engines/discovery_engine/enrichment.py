@@ -0,0 +1,25 @@
+# backend/app/engines/discovery_engine/enrichment.py
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Iterable
+
+
+async def fetch_all(
+    symbols: Iterable[str],
+    fetch: Callable[[str], Awaitable[Any]],
+    max_concurrency: int = 10,
+    timeout: float = 10.0,
+) -> Dict[str, Any]:
+    """
+    Run fetch(symbol) for every symbol with at most max_concurrency calls in flight.
+    The timeout covers each call, not its wait for a slot. Failed or timed-out symbols are omitted.
+    """
+    symbols = list(symbols)
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _fetch(symbol):
+        async with semaphore:
+            return await asyncio.wait_for(fetch(symbol), timeout)
+
+    results = await asyncio.gather(*(_fetch(s) for s in symbols), return_exceptions=True)
+    return {s: r for s, r in zip(symbols, results) if not isinstance(r, BaseException)}
@@ -0,0 +1,107 @@
+# backend/app/engines/discovery_engine/filter_engine.py
+
+from typing import Dict, List
+
+import numpy as np
+
+# Column defaults mirror the per-symbol rules: NaN for fields the rules indexed directly
+# (a missing value used to raise KeyError and skip the symbol; NaN fails every comparison),
+# and the .get() fallback value for optional fields.
+CRYPTO_FIELDS = {
+    "price": np.nan,
+    "atr": np.nan,
+    "ema_5m": 0.0,
+    "ema_15m": 0.0,
+    "confidence": 0.0,
+    "volume": np.nan,
+    "rsi": np.nan,
+    "macd": np.nan,
+    "volume_spike_5m": np.nan,
+    "recent_spike_candles": np.nan,
+    "velocity": np.nan,
+    "cmc_volume_24h": 0.0,
+    "cmc_market_cap": 0.0,
+}
+
+STOCK_FIELDS = {
+    "price": np.nan,
+    "volume_24h": 0.0,
+    "market_cap": np.nan,
+    "rsi": np.nan,
+    "macd": np.nan,
+    "ema_5": 0.0,
+    "ema_20": 0.0,
+    "atr": 999.0,
+    "rvol": 0.0,
+    "float": 0.0,
+    "leverage": 1.0,
+    "is_etf": 0.0,
+}
+
+
+def _to_float(value, default):
+    if value is None:
+        return default
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return default
+
+
+class SymbolTable:
+    """
+    Columnar snapshot of enriched symbol data: one float64 array per field, aligned with `symbols`.
+    """
+
+    def __init__(self, symbols: List[str], columns: Dict[str, np.ndarray]):
+        self.symbols = np.asarray(symbols, dtype=object)
+        self.columns = columns
+
+    @classmethod
+    def from_records(cls, records: Dict[str, dict], fields: Dict[str, float]) -> "SymbolTable":
+        symbols = list(records)
+        columns = {
+            field: np.fromiter(
+                (_to_float(records[s].get(field, default), default) for s in symbols),
+                dtype=float, count=len(symbols)
+            )
+            for field, default in fields.items()
+        }
+        return cls(symbols, columns)
+
+    def __getitem__(self, field: str) -> np.ndarray:
+        return self.columns[field]
+
+    def select(self, mask: np.ndarray) -> List[str]:
+        return self.symbols[mask].tolist()
+
+    def __len__(self):
+        return len(self.symbols)
+
+
+def crypto_table(enriched: Dict[str, tuple]) -> SymbolTable:
+    """
+    Build the crypto table from {symbol: (symbol_data, cmc_data)}.
+    """
+    records = {
+        symbol: {
+            **data,
+            "cmc_volume_24h": cmc_data.get("volume_24h", 0),
+            "cmc_market_cap": cmc_data.get("market_cap", 0),
+        }
+        for symbol, (data, cmc_data) in enriched.items()
+    }
+    table = SymbolTable.from_records(records, CRYPTO_FIELDS)
+
+    # Derived columns used by the strategy rules
+    price, atr = table["price"], table["atr"]
+    market_cap = table["cmc_market_cap"]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # ATR is only read when price > 0; a non-positive price counts as 0% ATR
+        table.columns["atr_pct"] = np.where(price > 0, atr / price, np.where(np.isnan(price), np.nan, 0.0))
+        table.columns["cmc_turnover"] = np.where(market_cap > 0, table["cmc_volume_24h"] / market_cap, np.nan)
+    return table
+
+
+def stock_table(symbol_data: Dict[str, dict]) -> SymbolTable:
+    return SymbolTable.from_records(symbol_data, STOCK_FIELDS)
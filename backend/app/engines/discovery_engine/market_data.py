@@ -2,6 +2,12 @@
 
 import aiohttp
 
+from app.engines.discovery_engine.source_cache import cached_source
+
+# Source cache lifetimes (seconds): fresh TTL, then stale-while-revalidate window
+CMC_TTL, CMC_STALE_TTL = 300, 900
+TRENDING_TTL, TRENDING_STALE_TTL = 60, 240
+
 class CryptoMarketData:
     def __init__(self, broker_client):
         self.broker_client = broker_client
@@ -16,6 +22,7 @@ class CryptoMarketData:
             symbols = [s for s in symbols if s.get('volume_24h', 0) >= 1_000_000]
         return [s['symbol'] for s in symbols if 'symbol' in s]
 
+    @cached_source(CMC_TTL, CMC_STALE_TTL)
     async def get_cmc_new_coins_filtered(self):
         """
         Simulated CoinMarketCap fetch for new coins.
@@ -26,6 +33,7 @@ class CryptoMarketData:
             '$GOLD': {'volume_24h': 5_409_807},
         }
 
+    @cached_source(CMC_TTL, CMC_STALE_TTL)
     async def get_cmc_trending_sorted(self):
         """
         Simulated CoinMarketCap trending coins by volume.
@@ -35,12 +43,14 @@ class CryptoMarketData:
             'BSV': {'volume_24h': 443_875_452},
         }
 
+    @cached_source(TRENDING_TTL, TRENDING_STALE_TTL)
     async def get_gmgn_trending(self):
         """
         Simulated GMGN trending symbols.
         """
         return ['ZAC', 'MUBARA']
 
+    @cached_source(TRENDING_TTL, TRENDING_STALE_TTL)
     async def get_pumpfun_trending(self):
         """
         Simulated Pump.Fun trending symbols.
@@ -65,6 +75,7 @@ class CryptoMarketData:
             'confidence': 0.96,
         }
 
+    @cached_source(CMC_TTL, CMC_STALE_TTL)
     async def get_cmc_symbol_data(self, symbol):
         """
         Simulated CMC volume/market cap data for a coin.
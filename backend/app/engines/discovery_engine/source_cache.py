@@ -0,0 +1,85 @@
+# backend/app/engines/discovery_engine/source_cache.py
+
+import asyncio
+import functools
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+
+
+class AsyncTTLCache:
+    """
+    Async TTL cache with stale-while-revalidate and single-flight loading.
+
+    - Fresh (age < ttl): served from cache.
+    - Stale (age < ttl + stale_ttl): served from cache while one background refresh runs.
+    - Missing/expired: callers share a single in-flight fetch for the key.
+    """
+
+    def __init__(self, max_entries: int = 10_000):
+        self.max_entries = max_entries
+        self.entries: Dict[Hashable, Tuple[float, Any]] = {}  # key -> (fetched_at, value)
+        self.in_flight: Dict[Hashable, asyncio.Task] = {}
+        self.stats = {"hits": 0, "stale_hits": 0, "misses": 0}
+
+    async def get(self, key: Hashable, fetch: Callable[[], Awaitable[Any]], ttl: float, stale_ttl: float = 0.0):
+        entry = self.entries.get(key)
+        if entry:
+            age = time.monotonic() - entry[0]
+            if age < ttl:
+                self.stats["hits"] += 1
+                return entry[1]
+            if age < ttl + stale_ttl:
+                self.stats["stale_hits"] += 1
+                self._load(key, fetch)
+                return entry[1]
+
+        self.stats["misses"] += 1
+        # Shield so one caller's timeout/cancel doesn't cancel the fetch shared by others
+        return await asyncio.shield(self._load(key, fetch))
+
+    def _load(self, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> asyncio.Task:
+        task = self.in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_and_store(key, fetch))
+            task.add_done_callback(self._consume_exception)
+            self.in_flight[key] = task
+        return task
+
+    async def _fetch_and_store(self, key: Hashable, fetch: Callable[[], Awaitable[Any]]):
+        try:
+            value = await fetch()
+            self.entries.pop(key, None)  # Re-insert so dict order tracks fetch recency
+            self.entries[key] = (time.monotonic(), value)
+            while len(self.entries) > self.max_entries:
+                del self.entries[next(iter(self.entries))]
+            return value
+        finally:
+            self.in_flight.pop(key, None)
+
+    @staticmethod
+    def _consume_exception(task: asyncio.Task):
+        # Background refreshes may fail unobserved; awaiting callers still see the error
+        if not task.cancelled():
+            task.exception()
+
+    def invalidate(self, key: Hashable = None):
+        if key is None:
+            self.entries.clear()
+        else:
+            self.entries.pop(key, None)
+
+
+source_cache = AsyncTTLCache()
+
+
+def cached_source(ttl: float, stale_ttl: float = 0.0):
+    """
+    Cache an async data-source method in source_cache, keyed by method and positional args.
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        async def wrapper(self, *args):
+            key = (method.__qualname__, args)
+            return await source_cache.get(key, lambda: method(self, *args), ttl, stale_ttl)
+        return wrapper
+    return decorator
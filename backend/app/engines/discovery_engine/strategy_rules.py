@@ -0,0 +1,162 @@
+# backend/app/engines/discovery_engine/strategy_rules.py
+
+import re
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from app.engines.discovery_engine.filter_engine import SymbolTable
+
+# A rule is (field, operator, threshold). A string threshold names another column.
+Rule = Tuple[str, str, Union[float, str]]
+
+OPERATORS = {
+    ">": np.greater,
+    ">=": np.greater_equal,
+    "<": np.less,
+    "<=": np.less_equal,
+    "==": np.equal,
+    "!=": np.not_equal,
+}
+
+# ----------------------
+# Strategy Definitions
+# ----------------------
+CRYPTO_BASE_RULES: List[Rule] = [
+    ("atr_pct", "<=", 0.05),
+    ("ema_5m", ">", "ema_15m"),
+    ("confidence", ">=", 0.95),
+]
+
+CRYPTO_STRATEGY_RULES: Dict[str, List[Rule]] = {
+    "Original": [
+        ("volume", ">", 500_000), ("rsi", ">", 55), ("macd", ">", 0),
+    ],
+    "100X Volume Spike": [
+        ("volume_spike_5m", ">=", 500_000), ("recent_spike_candles", "<=", 2),
+        ("rsi", ">", 55), ("macd", ">", 0), ("velocity", ">", 0.03),
+    ],
+    "Mid-Low Cap": [
+        ("cmc_market_cap", "<=", 1_500_000), ("volume", ">", 300_000),
+        ("rsi", ">", 55), ("cmc_turnover", ">", 0.5),
+    ],
+    "Micro Cap Moonshot": [
+        ("cmc_market_cap", "<=", 1_000_000), ("volume_spike_5m", ">=", 250_000),
+        ("atr", ">", 0.01), ("velocity", ">", 0.05),
+    ],
+}
+
+STOCK_STRATEGY_RULES: Dict[str, List[Rule]] = {
+    "freshman": [
+        ("market_cap", "<=", 500_000_000), ("rsi", ">", 55), ("macd", ">", 0), ("ema_5", ">", "ema_20"),
+    ],
+    "top_volume": [
+        ("volume_24h", ">=", 10_000_000), ("rsi", ">", 50), ("macd", ">", 0),
+    ],
+    "large_cap": [
+        ("market_cap", ">=", 10_000_000_000), ("rsi", ">", 50), ("macd", ">", 0), ("atr", "<", 5),
+    ],
+    "super_leverage": [
+        ("is_etf", ">", 0), ("leverage", ">", 1), ("rsi", ">", 50), ("macd", ">", 0),
+    ],
+    "cameron": [
+        ("price", ">=", 1), ("price", "<=", 10), ("rvol", ">=", 5),
+        ("volume_24h", ">=", 100_000), ("float", "<=", 20_000_000),
+    ],
+}
+
+
+def canonical_strategy_name(name: str) -> str:
+    """
+    Spelling-insensitive key: "Pump.Fun Trending", "PumpFun_Trending" -> "pumpfuntrending".
+    """
+    return re.sub(r"[^a-z0-9]", "", name.lower())
+
+
+# ----------------------
+# Compiler
+# ----------------------
+class _Predicate:
+    __slots__ = ("rule", "fn", "evaluated", "passed")
+
+    def __init__(self, rule: Rule):
+        field, op, threshold = rule
+        if op not in OPERATORS:
+            raise ValueError(f"Unsupported operator in rule {rule}")
+        compare = OPERATORS[op]
+
+        if isinstance(threshold, str):
+            self.fn = lambda cols, idx: compare(cols[field][idx], cols[threshold][idx])
+        else:
+            self.fn = lambda cols, idx: compare(cols[field][idx], threshold)
+
+        self.rule = rule
+        self.evaluated = 0
+        self.passed = 0
+
+    @property
+    def pass_rate(self) -> float:
+        # Unmeasured predicates sort first so they get measured
+        return self.passed / self.evaluated if self.evaluated else 0.0
+
+
+class CompiledStrategy:
+    """
+    Rules compiled once into NumPy comparisons. Each predicate only runs on rows that
+    survived the previous ones, and predicates are reordered by measured pass rate
+    so the most selective run first.
+    """
+
+    def __init__(self, name: str, rules: List[Rule]):
+        self.name = name
+        self.predicates = [_Predicate(rule) for rule in rules]
+
+    def mask(self, table: SymbolTable) -> np.ndarray:
+        mask = np.ones(len(table), dtype=bool)
+        idx = np.arange(len(table))
+
+        for predicate in self.predicates:
+            if not len(idx):
+                break
+            result = predicate.fn(table.columns, idx)
+            predicate.evaluated += len(idx)
+            predicate.passed += int(result.sum())
+            mask[idx[~result]] = False
+            idx = idx[result]
+
+        self.predicates.sort(key=lambda p: p.pass_rate)
+        return mask
+
+    def select(self, table: SymbolTable) -> List[str]:
+        return table.select(self.mask(table))
+
+
+class StrategyRegistry:
+    """
+    Named rule sets compiled on registration and looked up by spelling-insensitive name.
+    """
+
+    def __init__(self, base_rules: Optional[List[Rule]] = None):
+        self.base_rules = base_rules or []
+        self.strategies: Dict[str, CompiledStrategy] = {}
+
+    def register(self, name: str, rules: List[Rule]):
+        self.strategies[canonical_strategy_name(name)] = CompiledStrategy(name, self.base_rules + list(rules))
+
+    def get(self, name: str) -> Optional[CompiledStrategy]:
+        return self.strategies.get(canonical_strategy_name(name))
+
+    def names(self) -> List[str]:
+        return [s.name for s in self.strategies.values()]
+
+    def __contains__(self, name: str):
+        return canonical_strategy_name(name) in self.strategies
+
+
+crypto_strategies = StrategyRegistry(CRYPTO_BASE_RULES)
+for _name, _rules in CRYPTO_STRATEGY_RULES.items():
+    crypto_strategies.register(_name, _rules)
+
+stock_strategies = StrategyRegistry()
+for _name, _rules in STOCK_STRATEGY_RULES.items():
+    stock_strategies.register(_name, _rules)
@@ -1,39 +1,56 @@
 # backend/engines/execution_engine/trade_executor.py
 
 from datetime import datetime
-from typing import Dict, Any
+from typing import Any, Callable, Dict, List
 import asyncio
 
 from app.services.websocket_service import WebSocketService
-from app.engines.trade_tracking.trade_summary import TradeSummary
+from app.engines.trade_tracking.trade_summary import trade_summary as default_trade_summary
 from app.engines.trade_tracking.trade_logger import TradeLogger
-from app.db.database import SessionLocal
+from app.utils.bar_store import bar_store as default_bar_store
 
 class TradeExecutor:
-    def __init__(self, broker_client, risk_manager, strategy_manager, forecast_engine):
+    def __init__(self, broker_client, risk_manager, strategy_manager, forecast_engine, bar_store=None, trade_summary=None):
         self.broker_client = broker_client
+        self.bar_store = bar_store or default_bar_store
         self.risk_manager = risk_manager
         self.strategy_manager = strategy_manager
         self.forecast_engine = forecast_engine
         self.open_trades: Dict[str, Dict[str, Any]] = {}
         self.win_streak: Dict[str, int] = {}
-        self.trade_summary = TradeSummary()
-        self.trade_logger = TradeLogger(SessionLocal())
+        self.trade_summary = trade_summary or default_trade_summary
+        self.trade_logger = TradeLogger()
+
+        # Notified with the trade dict after an open and the trade_id after a close
+        self.open_listeners: List[Callable[[Dict[str, Any]], None]] = []
+        self.close_listeners: List[Callable[[str], None]] = []
+
+    async def start(self):
+        """
+        Start the trade logger's background writer; call from the running loop before trading.
+        """
+        await self.trade_logger.start()
 
     async def execute_trade(self, symbol: str, market_data: Dict[str, Any], account_data: Dict[str, Any], mode_settings: Dict[str, Any]) -> str:
         try:
             price = market_data['price']
-            highs = market_data['highs']
-            lows = market_data['lows']
-            closes = market_data['closes']
+
             velocity = market_data.get('velocity', 0)
             win_streak = market_data.get('win_streak', 0)
 
-            forecast = self.forecast_engine.forecast(highs, lows, closes, velocity)
+            # Prefer the symbol's ring buffer, folding only bars closed since the last call
+            # into the forecast engine's rolling state; fall back to supplied lists
+            series = self.bar_store.get(symbol)
+            if series is not None and len(series) > 1:
+                forecast = self.forecast_engine.forecast_series(symbol, series, velocity)
+            else:
+                series = None
+                closes = market_data['closes']
+                forecast = self.forecast_engine.forecast(market_data['highs'], market_data['lows'], closes, velocity)
             confidence = forecast.get('confidence', 0)
             tp = forecast.get('tp')
             sl = forecast.get('sl')
-            atr = self.forecast_engine.calculate_atr(highs, lows, closes)
+            atr = forecast.get('atr')
 
             if not self.risk_manager.check_volatility_filter(atr, price):
                 return "volatility_filtered"
@@ -63,7 +80,8 @@ class TradeExecutor:
                 "size": position_size,
                 "entry_time": datetime.utcnow(),
                 "mode": mode_settings.get("mode", "easy"),
-                "recent_prices": closes[-3:] if len(closes) >= 3 else closes,
+                # AutoCloseEngine reads momentum from the bar store when the symbol has one
+                "recent_prices": [] if series is not None else closes[-3:],
                 "atr": atr,
                 "trailing_anchor": forecast.get("trailing_anchor", 0.75),
                 "broker_id": account_data.get("broker_id", "unknown"),
@@ -81,6 +99,8 @@ class TradeExecutor:
             if trade_id:
                 trade["trade_id"] = trade_id
                 self.open_trades[trade_id] = trade
+                for listener in self.open_listeners:
+                    listener(trade)
 
                 await self.trade_logger.log_trade_open(trade, account_data)
 
@@ -112,13 +132,18 @@ class TradeExecutor:
         trade = self.open_trades.pop(trade_id, None)
         if not trade:
             return
+        for listener in self.close_listeners:
+            listener(trade_id)
 
         broker_id = trade.get("broker_id", "unknown")
         gain_pct = result.get("gain_pct", 0) if result else 0
         gain_usd = result.get("gain_usd", 0) if result else 0
-        reason = result.get("reason", "manual_close")
+        reason = result.get("reason", "manual_close") if result else "manual_close"
 
-        trade["exit_price"] = trade["entry_price"] + (gain_usd * 100 / trade["size"]) if trade["side"] == "buy" else trade["entry_price"] - (gain_usd * 100 / trade["size"])
+        if result and result.get("exit_price") is not None:
+            trade["exit_price"] = result["exit_price"]
+        else:
+            trade["exit_price"] = trade["entry_price"] + (gain_usd * 100 / trade["size"]) if trade["side"] == "buy" else trade["entry_price"] - (gain_usd * 100 / trade["size"])
 
         # ✅ Win streak tracking
         if gain_pct > 0:
@@ -166,6 +191,7 @@ class TradeExecutor:
         asyncio.create_task(self.trade_summary.record_trade_close({
             "symbol": trade["symbol"],
             "trade_id": trade_id,
+            "side": trade.get("side", "buy"),
             "mode": trade.get("mode"),
             "model_id": trade.get("model_id"),
             "strategy_id": trade.get("strategy_id"),
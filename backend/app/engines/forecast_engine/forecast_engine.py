@@ -1,12 +1,18 @@
 # backend/engines/forecast_engine/forecast_engine.py
 
+from collections import deque
+from typing import Dict, Any
+
 import numpy as np
 
 class ForecastEngine:
-    def __init__(self, mode_settings):
+    TREND_WINDOW = 5
+
+    def __init__(self, mode_settings, atr_period: int = 14):
         # Mode-sensitive TP/SL scaling
         self.mode = mode_settings.get("mode", "easy")
         self.trail_to_moon_active = mode_settings.get("trail_to_moon_active", True)
+        self.atr_period = atr_period
 
         # Expanded multipliers for TP and SL curves
         self.tp_multipliers = {
@@ -24,13 +30,56 @@ class ForecastEngine:
             "hard": 0.55   # Trails at 55% of peak move (Deep Hold)
         }
 
+        # Incremental mode: rolling per-symbol state (Wilder ATR, last close, trend window)
+        self.symbol_state: Dict[str, Dict[str, Any]] = {}
+
     def forecast(self, highs, lows, closes, breakout_velocity=0):
         """
         Generate TP and SL forecasts based on ATR, trend strength, mode, and Trail-to-Moon logic.
         """
-        atr = self.calculate_atr(highs, lows, closes)
+        atr = self.calculate_atr(highs, lows, closes, self.atr_period)
         trend_strength = self.calculate_trend_strength(closes)
+        return self._build_forecast(atr, trend_strength, breakout_velocity)
+
+    def forecast_batch(self, highs, lows, closes, breakout_velocity=None):
+        """
+        Vectorized forecast over a whole symbol universe.
+        :param highs/lows/closes: 2-D arrays shaped (symbols, bars).
+        :param breakout_velocity: Optional per-symbol velocity vector (or scalar).
+        :return: Dict of per-symbol arrays aligned with the input rows.
+        """
+        highs = np.atleast_2d(np.asarray(highs, dtype=float))
+        lows = np.atleast_2d(np.asarray(lows, dtype=float))
+        closes = np.atleast_2d(np.asarray(closes, dtype=float))
+        n_symbols = closes.shape[0]
+
+        if breakout_velocity is None:
+            velocity = np.zeros(n_symbols)
+        else:
+            velocity = np.broadcast_to(np.asarray(breakout_velocity, dtype=float), (n_symbols,))
+
+        atr = self.calculate_atr_batch(highs, lows, closes, self.atr_period)
+        trend_strength = self.calculate_trend_strength_batch(closes)
+
+        base_tp = atr * self.tp_multipliers[self.mode] * trend_strength
+        sl = atr * self.sl_multipliers[self.mode] / trend_strength
+
+        if self.trail_to_moon_active:
+            extended_tp = np.where(velocity > 0, base_tp * (1 + velocity), base_tp)
+        else:
+            extended_tp = base_tp
+
+        confidence = np.minimum(1.0, 0.9 + (trend_strength - 1.0) * 0.05)
 
+        return {
+            "tp": extended_tp,
+            "sl": sl,
+            "atr": atr,
+            "confidence": confidence,
+            "trailing_anchor": np.full(n_symbols, self.trailing_anchors[self.mode])
+        }
+
+    def _build_forecast(self, atr, trend_strength, breakout_velocity=0):
         tp_multiplier = self.tp_multipliers[self.mode]
         sl_multiplier = self.sl_multipliers[self.mode]
 
@@ -48,24 +97,121 @@ class ForecastEngine:
         return {
             "tp": extended_tp,
             "sl": sl,
+            "atr": atr,  # Exposed so callers don't recompute it
             "confidence": confidence,
             "trailing_anchor": self.trailing_anchors[self.mode]
         }
 
     def calculate_atr(self, highs, lows, closes, period=14):
-        trs = []
-        for i in range(1, len(closes)):
-            tr = max(highs[i] - lows[i], abs(highs[i] - closes[i-1]), abs(lows[i] - closes[i-1]))
-            trs.append(tr)
-        return np.mean(trs[-period:])
+        highs = np.asarray(highs, dtype=float)
+        lows = np.asarray(lows, dtype=float)
+        closes = np.asarray(closes, dtype=float)
+
+        prev_closes = closes[:-1]
+        trs = np.maximum.reduce([
+            highs[1:] - lows[1:],
+            np.abs(highs[1:] - prev_closes),
+            np.abs(lows[1:] - prev_closes),
+        ])
+        return float(np.mean(trs[-period:]))
+
+    def calculate_atr_batch(self, highs, lows, closes, period=14):
+        """
+        Row-wise ATR for (symbols, bars) arrays; matches calculate_atr per row.
+        """
+        prev_closes = closes[:, :-1]
+        trs = np.maximum.reduce([
+            highs[:, 1:] - lows[:, 1:],
+            np.abs(highs[:, 1:] - prev_closes),
+            np.abs(lows[:, 1:] - prev_closes),
+        ])
+        return trs[:, -period:].mean(axis=1)
+
+    def calculate_trend_strength_batch(self, closes):
+        """
+        Row-wise trend strength for a (symbols, bars) close array.
+        """
+        recent = closes[:, -self.TREND_WINDOW:]
+        slope = (recent[:, -1] - recent[:, 0]) / self.TREND_WINDOW
+        volatility = recent.std(axis=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ratio = np.abs(slope) / volatility
+        return np.where(volatility == 0, 1.0, np.maximum(1.0, ratio))
 
     def calculate_trend_strength(self, closes):
-        recent = closes[-5:]
-        slope = (recent[-1] - recent[0]) / 5
+        recent = np.asarray(closes[-self.TREND_WINDOW:], dtype=float)
+        slope = (recent[-1] - recent[0]) / self.TREND_WINDOW
         volatility = np.std(recent)
         if volatility == 0:
             return 1.0
-        return max(1.0, abs(slope) / volatility)
+        return max(1.0, float(abs(slope) / volatility))
 
     def calculate_confidence(self, trend_strength):
         return min(1.0, 0.9 + (trend_strength - 1.0) * 0.05)
+
+    # ----------------------
+    # Incremental Mode
+    # ----------------------
+    def forecast_series(self, symbol, series, breakout_velocity=0):
+        """
+        Incremental forecast from a BarStore series. Bars closed since the previous call
+        are folded in with update_bar (O(1) each); the last bar is still forming, so it is
+        only folded once a newer bar opens. The symbol is (re)seeded from the series when
+        it is new, when the series was replaced, or when more bars closed than it retains.
+        """
+        closed = series.count - 1
+        if closed < 2:
+            return self.forecast(series.highs(), series.lows(), series.closes(), breakout_velocity)
+
+        state = self.symbol_state.get(symbol)
+        new_bars = closed - state["bars"] if state and state["series"] is series else -1
+        if new_bars < 0 or new_bars > len(series) - 1:
+            bars = series.window()[:-1]
+            self.seed_symbol(symbol, bars["high"], bars["low"], bars["close"])
+            state = self.symbol_state[symbol]
+        elif new_bars:
+            for bar in series.window(new_bars + 1)[:-1]:
+                self.update_bar(symbol, bar["high"], bar["low"], bar["close"])
+        state["series"], state["bars"] = series, closed
+
+        trend_strength = self.calculate_trend_strength(list(state["recent_closes"]))
+        return self._build_forecast(state["atr"], trend_strength, breakout_velocity)
+
+    def seed_symbol(self, symbol, highs, lows, closes):
+        """
+        Initialize rolling state for a symbol from its bar history.
+        The seed ATR matches calculate_atr so both paths agree on the first bar.
+        """
+        self.symbol_state[symbol] = {
+            "atr": self.calculate_atr(highs, lows, closes, self.atr_period),
+            "last_close": float(closes[-1]),
+            "recent_closes": deque((float(c) for c in closes[-self.TREND_WINDOW:]), maxlen=self.TREND_WINDOW),
+            # Set by forecast_series: the BarSeries followed and how many of its closed bars are folded in
+            "series": None,
+            "bars": 0,
+        }
+
+    def update_bar(self, symbol, high, low, close, breakout_velocity=0):
+        """
+        Fold one new bar into a seeded symbol's state in O(1) and return its forecast.
+        ATR is Wilder-smoothed: atr = (atr * (n - 1) + tr) / n.
+        """
+        state = self.symbol_state.get(symbol)
+        if state is None:
+            raise KeyError(f"Symbol {symbol} has not been seeded")
+
+        prev_close = state["last_close"]
+        tr = max(high - low, abs(high - prev_close), abs(low - prev_close))
+        state["atr"] = (state["atr"] * (self.atr_period - 1) + tr) / self.atr_period
+        state["last_close"] = float(close)
+        state["recent_closes"].append(float(close))
+
+        trend_strength = self.calculate_trend_strength(list(state["recent_closes"]))
+        return self._build_forecast(state["atr"], trend_strength, breakout_velocity)
+
+    def get_symbol_atr(self, symbol):
+        state = self.symbol_state.get(symbol)
+        return state["atr"] if state else None
+
+    def drop_symbol(self, symbol):
+        self.symbol_state.pop(symbol, None)
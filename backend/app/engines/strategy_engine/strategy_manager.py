@@ -2,8 +2,8 @@
 
 class StrategyManager:
     VALID_STRATEGIES = [
-        'CoinMarketCap', 'Micro Cap Moonshot', '100X Volume Spike', 'Pump.Fun Trending', 'GMGN Trending',
-        'original', 'mid_low_cap',
+        'CoinMarketCap', 'Micro Cap Moonshot', '100X Volume Spike', 'PumpFun_Trending', 'GMGN_Trending',
+        'Original', 'Mid-Low Cap',
         'freshman', 'top_volume', 'large_cap', 'super_leverage', 'cameron'
     ]
 
@@ -58,10 +58,10 @@ class StrategyManager:
 
         symbol_strategy_map = {
             'WIF': ['Micro Cap Moonshot', '100X Volume Spike'],
-            'BTC-USD': ['original', 'large_cap'],
-            'ETH-USD': ['original', 'large_cap'],
-            'FLOKI': ['Micro Cap Moonshot', 'mid_low_cap'],
-            'SOL-USD': ['original', 'large_cap'],
+            'BTC-USD': ['Original', 'large_cap'],
+            'ETH-USD': ['Original', 'large_cap'],
+            'FLOKI': ['Micro Cap Moonshot', 'Mid-Low Cap'],
+            'SOL-USD': ['Original', 'large_cap'],
         }
 
         for symbol in top_symbols[:5]:
@@ -1,10 +1,62 @@
 # backend/engines/trade_tracking/trade_logger.py
 
+import asyncio
 import datetime
+import json
+import logging
+import os
+from typing import Dict, List, Tuple
+
+# Rows that could not be written after max_retries attempts (or overflowed the queue) are appended here as JSON lines
+DEAD_LETTER_PATH = os.getenv("TRADE_DEAD_LETTER_PATH", "trade_dead_letter.jsonl")
 
 class TradeLogger:
-    def __init__(self, db_session):
-        self.db_session = db_session
+    """
+    Write-behind trade logger: log calls only enqueue, and a background writer flushes
+    opens and closes as multi-row INSERT/UPDATE statements every `flush_interval`
+    seconds or as soon as `batch_size` rows are pending.
+
+    A row whose write fails is retried on its own (so one bad row cannot fail a whole
+    batch again) up to `max_retries` times, then dead-lettered. While writes keep
+    failing the writer backs off, and at most `max_pending` rows are queued; beyond
+    that the oldest are dead-lettered.
+
+    Rows only queue until start() launches the writer from a running event loop;
+    flush() and close() write whatever is queued either way. The database layer is
+    imported on first write, keeping app.db (and app.core) off the engines' import path.
+    """
+
+    def __init__(self, session_factory=None, flush_interval: float = 0.25, batch_size: int = 100,
+                 max_retries: int = 5, max_pending: int = 10_000, max_backoff: float = 30.0,
+                 dead_letter_path: str = DEAD_LETTER_PATH):
+        # Each flush checks out its own pooled AsyncSession instead of holding one open
+        self.session_factory = session_factory
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.max_retries = max_retries
+        self.max_pending = max_pending
+        self.max_backoff = max_backoff
+        self.dead_letter_path = dead_letter_path
+
+        self.pending_opens: List[dict] = []
+        self.pending_closes: Dict[str, dict] = {}
+        self.attempts: Dict[Tuple[str, str], int] = {}  # ("open" | "close", trade_id) -> failed writes
+        self.consecutive_failures = 0
+        self.dead_lettered = 0
+        self.flush_requested = None  # asyncio primitives and the writer are created by start()
+        self.flush_lock = None
+        self.writer_task = None
+
+    async def start(self):
+        """
+        Launch the background writer on the running event loop.
+        """
+        if self.writer_task is not None and not self.writer_task.done():
+            return
+        self.flush_requested = asyncio.Event()
+        if self.flush_lock is None:
+            self.flush_lock = asyncio.Lock()
+        self.writer_task = asyncio.create_task(self._writer())
 
     async def log_trade_open(self, trade_details, account_snapshot):
         """
@@ -33,7 +85,8 @@ class TradeLogger:
             'margin_percent': account_snapshot.get('margin_percent'),
             'allocation_amount': trade_details.get('size'),
         }
-        await self.db_session.insert_trade(trade_record)
+        self.pending_opens.append(trade_record)
+        self._enqueued()
 
     async def log_trade_close(self, trade_details, exit_reason, close_price):
         """
@@ -57,10 +110,151 @@ class TradeLogger:
             'gain_dollar': round(gain_dollar, 2) if gain_dollar is not None else None,
             'gain_pct': round(gain_pct, 2) if gain_pct is not None else None,
         }
-        await self.db_session.update_trade(trade_details['trade_id'], update_fields)
+        self.pending_closes[trade_details['trade_id']] = {'trade_id': trade_details['trade_id'], **update_fields}
+        self._enqueued()
 
     async def fetch_trade_history(self, symbol=None):
         """
         Retrieves trade history from the database.
         """
-        return await self.db_session.get_trade_history(symbol)
+        from app.db import crud
+
+        await self.flush()  # Include anything still queued
+        async with self._session_factory()() as session:
+            return await crud.get_trade_history(session, symbol)
+
+    # ----------------------
+    # Write-behind queue
+    # ----------------------
+    def _session_factory(self):
+        if self.session_factory is None:
+            from app.db.database import AsyncSessionLocal
+            self.session_factory = AsyncSessionLocal
+        return self.session_factory
+
+    def _enqueued(self):
+        overflow = len(self.pending_opens) + len(self.pending_closes) - self.max_pending
+        if overflow > 0:
+            dropped_opens, self.pending_opens = self.pending_opens[:overflow], self.pending_opens[overflow:]
+            self._dead_letter("open", dropped_opens, "queue full")
+            overflow -= len(dropped_opens)
+            for trade_id in list(self.pending_closes)[:max(overflow, 0)]:
+                self._dead_letter("close", [self.pending_closes.pop(trade_id)], "queue full")
+
+        if self.flush_requested is not None and len(self.pending_opens) + len(self.pending_closes) >= self.batch_size:
+            self.flush_requested.set()
+
+    async def _writer(self):
+        while True:
+            if self.consecutive_failures:
+                # Database unavailable: back off instead of retrying on every enqueue
+                await asyncio.sleep(min(self.flush_interval * 2 ** self.consecutive_failures, self.max_backoff))
+            else:
+                try:
+                    await asyncio.wait_for(self.flush_requested.wait(), timeout=self.flush_interval)
+                except asyncio.TimeoutError:
+                    pass
+            self.flush_requested.clear()
+            await self.flush()
+
+    async def flush(self):
+        """
+        Write all queued opens, then closes, in one session. New rows go out as one
+        multi-row statement per kind; previously failed rows one statement each.
+        """
+        if self.flush_lock is None:
+            self.flush_lock = asyncio.Lock()
+        async with self.flush_lock:
+            opens, self.pending_opens = self.pending_opens, []
+            closes, self.pending_closes = self.pending_closes, {}
+            if not opens and not closes:
+                return
+
+            requeued_opens: List[dict] = []
+            requeued_closes: Dict[str, dict] = {}
+            failed = False
+            async with self._session_factory()() as session:
+                for batch in self._batches("open", opens):
+                    if not await self._write(session, "open", batch):
+                        failed = True
+                        requeued_opens.extend(self._failed("open", batch))
+
+                # A close must not run before its trade's insert has landed
+                unopened = {row['trade_id'] for row in requeued_opens}
+                ready = [row for trade_id, row in closes.items() if trade_id not in unopened]
+                requeued_closes.update((trade_id, row) for trade_id, row in closes.items() if trade_id in unopened)
+                for batch in self._batches("close", ready):
+                    if not await self._write(session, "close", batch):
+                        failed = True
+                        requeued_closes.update((row['trade_id'], row) for row in self._failed("close", batch))
+
+            self.consecutive_failures = self.consecutive_failures + 1 if failed else 0
+            self.pending_opens[:0] = requeued_opens
+            self.pending_closes = {**requeued_closes, **self.pending_closes}
+
+    def _batches(self, kind: str, rows: List[dict]) -> List[List[dict]]:
+        fresh = [row for row in rows if (kind, row['trade_id']) not in self.attempts]
+        retried = [[row] for row in rows if (kind, row['trade_id']) in self.attempts]
+        return ([fresh] if fresh else []) + retried
+
+    async def _write(self, session, kind: str, batch: List[dict]) -> bool:
+        from app.db import crud
+
+        try:
+            if kind == "open":
+                await crud.insert_trades(session, batch)
+            else:
+                await crud.update_trades(session, batch)
+        except Exception as e:
+            logging.error(f"[TradeLogger] Writing {len(batch)} {kind} row(s) failed: {e}")
+            try:
+                await session.rollback()
+            except Exception:
+                pass
+            return False
+
+        for row in batch:
+            self.attempts.pop((kind, row['trade_id']), None)
+        return True
+
+    def _failed(self, kind: str, batch: List[dict]) -> List[dict]:
+        """
+        Count a failed write against each row; return the rows to retry and dead-letter the rest.
+        """
+        retry = []
+        for row in batch:
+            key = (kind, row['trade_id'])
+            self.attempts[key] = self.attempts.get(key, 0) + 1
+            if self.attempts[key] < self.max_retries:
+                retry.append(row)
+            else:
+                del self.attempts[key]
+                self._dead_letter(kind, [row], f"failed {self.max_retries} writes")
+        return retry
+
+    def _dead_letter(self, kind: str, rows: List[dict], reason: str):
+        if not rows:
+            return
+        self.dead_lettered += len(rows)
+        logging.error(f"[TradeLogger] Dropping {len(rows)} {kind} row(s) ({reason}) to {self.dead_letter_path or 'nowhere'}")
+        for row in rows:
+            self.attempts.pop((kind, row['trade_id']), None)
+        if not self.dead_letter_path:
+            return
+        try:
+            with open(self.dead_letter_path, "a") as f:
+                for row in rows:
+                    f.write(json.dumps({"kind": kind, "reason": reason, "row": row}, default=str) + "\n")
+        except OSError as e:
+            logging.error(f"[TradeLogger] Dead-letter write failed: {e}")
+
+    async def close(self):
+        """
+        Stop the background writer and flush what is left.
+        """
+        if self.writer_task:
+            self.writer_task.cancel()
+            await asyncio.gather(self.writer_task, return_exceptions=True)
+            self.writer_task = None
+        self.flush_requested = None
+        await self.flush()
@@ -1,54 +1,212 @@
 # backend/app/engines/trade_tracking/trade_summary.py
 
+import logging
+import time
+from collections import deque
 from datetime import datetime
-from typing import List, Dict
+from typing import Awaitable, Callable, Deque, Dict, List, Optional, Tuple
 
+# Dimensions aggregated for dashboard breakdowns
+DIMENSIONS = ("symbol", "model", "strategy", "mode")
+
+# Rolling windows in seconds; None is all-time
+WINDOWS = {"1h": 3600, "24h": 86400, "7d": 7 * 86400}
+
+
+class ClosedTrade:
+    __slots__ = (
+        "symbol", "trade_id", "side", "entry_price", "exit_price", "gain_pct", "gain_usd",
+        "confidence", "size", "mode", "strategy", "model", "reason",
+        "timestamp_opened", "timestamp_closed", "closed_at",
+    )
+
+    def __init__(self, **fields):
+        for name in self.__slots__:
+            setattr(self, name, fields.get(name))
+
+    def keys(self) -> Tuple[Tuple[str, object], ...]:
+        return (("all", None),) + tuple((dim, getattr(self, dim)) for dim in DIMENSIONS)
+
+    def to_dict(self) -> Dict:
+        return {name: getattr(self, name) for name in self.__slots__ if name != "closed_at"}
+
+
+class _Aggregate:
+    __slots__ = ("trades", "wins", "gain_usd", "gain_pct")
 
-class TradeSummary:
     def __init__(self):
-        self.closed_trades: List[Dict] = []
+        self.trades = 0
+        self.wins = 0
+        self.gain_usd = 0.0
+        self.gain_pct = 0.0
+
+    def add(self, row: ClosedTrade):
+        self.trades += 1
+        self.wins += row.gain_usd > 0
+        self.gain_usd += row.gain_usd
+        self.gain_pct += row.gain_pct
+
+    def subtract(self, other: "_Aggregate"):
+        self.trades -= other.trades
+        self.wins -= other.wins
+        self.gain_usd -= other.gain_usd
+        self.gain_pct -= other.gain_pct
+
+    def to_dict(self) -> Dict:
+        return {
+            "trades": self.trades,
+            "wins": self.wins,
+            "win_rate": round(self.wins / self.trades, 4) if self.trades else 0.0,
+            "pnl_usd": round(self.gain_usd, 2),
+            "avg_gain_pct": round(self.gain_pct / self.trades, 2) if self.trades else 0.0,
+        }
+
+
+class _RollingAggregates:
+    """
+    Aggregates over the trailing `span` seconds (all-time if None).
+
+    Rows are folded into time buckets of span / `buckets` seconds, and whole buckets are
+    subtracted back out as they age past the window, so memory depends on the bucket
+    count and key cardinality, never on the number of trades.
+    """
+
+    def __init__(self, span: Optional[float], buckets: int = 60):
+        self.span = span
+        self.bucket_width = span / buckets if span else None
+        self.buckets: Deque[Tuple[float, Dict[Tuple[str, object], _Aggregate]]] = deque()
+        self.aggregates: Dict[Tuple[str, object], _Aggregate] = {}
+
+    def add(self, row: ClosedTrade):
+        self.expire(row.closed_at)
+        targets = [self.aggregates]
+        if self.bucket_width:
+            start = row.closed_at - row.closed_at % self.bucket_width
+            if not self.buckets or self.buckets[-1][0] != start:
+                self.buckets.append((start, {}))
+            targets.append(self.buckets[-1][1])
 
-    async def record_trade_close(self, trade: Dict, close_price: float, exit_reason: str):
+        for aggregates in targets:
+            for key in row.keys():
+                agg = aggregates.get(key)
+                if agg is None:
+                    agg = aggregates[key] = _Aggregate()
+                agg.add(row)
+
+    def expire(self, now: float):
+        if not self.bucket_width:
+            return
+        cutoff = now - self.span
+        while self.buckets and self.buckets[0][0] + self.bucket_width <= cutoff:
+            _, bucket = self.buckets.popleft()
+            for key, expired in bucket.items():
+                agg = self.aggregates[key]
+                agg.subtract(expired)
+                if not agg.trades:
+                    del self.aggregates[key]
+
+
+class TradeSummary:
+    """
+    Closed-trade analytics with incremental aggregates (P&L, win rate, average gain)
+    per symbol/model/strategy/mode over rolling windows, so dashboard reads are O(1).
+
+    Only the newest `max_rows` rows stay in memory; older ones are handed to the
+    optional `spill` callback and dropped. Aggregates keep covering them. Closed trades
+    are already persisted by TradeLogger, so the default instance spills nowhere.
+    """
+
+    def __init__(self, max_rows: int = 5000, spill: Optional[Callable[[List[Dict]], Awaitable[None]]] = None,
+                 spill_batch: int = 500):
+        self.max_rows = max_rows
+        self.spill = spill
+        self.spill_batch = spill_batch
+        self.closed_trades: Deque[ClosedTrade] = deque()
+        self.windows = {name: _RollingAggregates(span) for name, span in WINDOWS.items()}
+        self.windows[None] = _RollingAggregates(None)
+
+    async def record_trade_close(self, trade: Dict, close_price: Optional[float] = None, exit_reason: Optional[str] = None):
         """
         Store a closed trade summary for analytics.
         """
+        close_price = trade.get("exit_price", 0.0) if close_price is None else close_price
+        exit_reason = trade.get("exit_reason") if exit_reason is None else exit_reason
         entry_price = trade.get("entry_price", 0.0)
-        size = trade.get("size", 0.0)
+        size = trade.get("size") or 0.0
         side = trade.get("side", "buy")
 
         gain = (close_price - entry_price) if side == "buy" else (entry_price - close_price)
         gain_usd = gain * size
         gain_pct = (gain / entry_price) * 100 if entry_price else 0.0
 
-        summary = {
-            "symbol": trade["symbol"],
-            "trade_id": trade["trade_id"],
-            "side": side,
-            "entry_price": entry_price,
-            "exit_price": close_price,
-            "gain_pct": round(gain_pct, 2),
-            "gain_usd": round(gain_usd, 2),
-            "confidence": round(trade.get("initial_confidence", 0.0), 4),
-            "size": size,
-            "mode": trade.get("mode"),
-            "strategy": trade.get("strategy_id", "N/A"),
-            "model": trade.get("model_id", "N/A"),
-            "reason": exit_reason,
-            "timestamp_opened": trade.get("entry_time"),
-            "timestamp_closed": datetime.utcnow()
-        }
+        row = ClosedTrade(
+            symbol=trade["symbol"],
+            trade_id=trade["trade_id"],
+            side=side,
+            entry_price=entry_price,
+            exit_price=close_price,
+            gain_pct=round(gain_pct, 2),
+            gain_usd=round(gain_usd, 2),
+            confidence=round(trade.get("initial_confidence", trade.get("confidence")) or 0.0, 4),
+            size=size,
+            mode=trade.get("mode"),
+            strategy=trade.get("strategy_id", "N/A"),
+            model=trade.get("model_id", "N/A"),
+            reason=exit_reason,
+            timestamp_opened=trade.get("entry_time"),
+            timestamp_closed=datetime.utcnow(),
+            closed_at=time.time(),
+        )
+
+        self.closed_trades.append(row)
+        for window in self.windows.values():
+            window.add(row)
 
-        self.closed_trades.append(summary)
-        return summary
+        if len(self.closed_trades) >= self.max_rows + self.spill_batch:
+            await self._spill()
+        return row.to_dict()
+
+    async def _spill(self):
+        evicted = [self.closed_trades.popleft().to_dict() for _ in range(len(self.closed_trades) - self.max_rows)]
+        if self.spill:
+            try:
+                await self.spill(evicted)
+            except Exception as e:
+                logging.warning(f"[TradeSummary] Spill of {len(evicted)} rows failed: {e}")
+
+    # ----------------------
+    # Dashboard reads
+    # ----------------------
+    def get_stats(self, dimension: str = "all", key=None, window: Optional[str] = None) -> Dict:
+        """
+        Aggregates for one slice, e.g. get_stats("model", "Hexacoin", "24h").
+        """
+        rolling = self.windows[window]
+        rolling.expire(time.time())
+        agg = rolling.aggregates.get((dimension, key))
+        return (agg or _Aggregate()).to_dict()
+
+    def get_breakdown(self, dimension: str, window: Optional[str] = None) -> Dict[object, Dict]:
+        """
+        Aggregates for every value of a dimension.
+        """
+        rolling = self.windows[window]
+        rolling.expire(time.time())
+        return {key: agg.to_dict() for (dim, key), agg in rolling.aggregates.items() if dim == dimension}
 
     def get_summary(self) -> List[Dict]:
         """
-        Returns the list of all closed trade summaries.
+        Returns the in-memory closed trade summaries (newest `max_rows`).
         """
-        return self.closed_trades
+        return [row.to_dict() for row in self.closed_trades]
 
     def reset(self):
         """
-        Clears all recorded summaries.
+        Clears all recorded summaries and aggregates.
         """
         self.closed_trades.clear()
+        self.windows = {name: _RollingAggregates(span) for name, span in WINDOWS.items()}
+        self.windows[None] = _RollingAggregates(None)
+
+
+trade_summary = TradeSummary()
@@ -8,10 +8,14 @@ from app.api.routes import (
     models as model_routes,
     websocket as websocket_routes
 )
-from app.utils.database import connect_db
 from app.utils.market_data import initialize_market_feeds
 from app.engines.trading_loop import run_trading_cycle
 from app.core.scheduler import start_scheduler
+from app.utils.broker_clients.http_pool import HTTPClientPool
+from app.services.trading_runtime import trading_runtime
+from app.db.database import close_db, init_db
+from app.services.broadcast_backend import broadcast_bus, create_backend
+from app.models.model_registry import _model_registry
 import asyncio
 import logging
 import os
@@ -57,13 +61,28 @@ async def startup_event():
     logging.basicConfig(level=logging.INFO)
     logging.info("🚀 Ultima Bot backend starting...")
 
-    await connect_db()
+    await init_db()  # Create missing tables on the pooled async engine
     await initialize_market_feeds()
     start_scheduler()  # ⏰ Launch scheduler tasks
+    await trading_runtime.start()  # Market data streams per configured broker, feeding the bar store
+    await broadcast_bus.start(create_backend())  # Cross-worker WebSocket events
+    _model_registry.enable_process_pool()  # No-op unless MODEL_PROCESS_WORKERS > 0
     asyncio.create_task(run_trading_cycle())
 
     logging.info("Ultima Bot backend initialized and running.")
 
+# -------------------------
+# Shutdown Lifecycle Hook
+# -------------------------
+@app.on_event("shutdown")
+async def shutdown_event():
+    await trading_runtime.stop()
+    await broadcast_bus.stop()
+    _model_registry.shutdown_process_pool()
+    await HTTPClientPool.close_all()  # Close pooled broker connections
+    await close_db()  # Release pooled DB connections
+    logging.info("Ultima Bot backend stopped.")
+
 # -------------------------
 # Entrypoint for Uvicorn
 # -------------------------
@@ -1,10 +1,14 @@
-import joblib
 import os
 
-class AntimatterModel:
+from app.models.joblib_cache import load_joblib
+from app.models.model_wrapper import ModelWrapper
+
+class AntimatterModel(ModelWrapper):
+    MODEL_NAME = 'Antimatter'  # Registry key
+
     def __init__(self):
         model_path = os.path.join(os.path.dirname(__file__), 'joblib', 'Antimatter.joblib')
-        self.model = joblib.load(model_path)
+        self.model = load_joblib(model_path)
 
     def predict(self, features):
         """
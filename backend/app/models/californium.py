@@ -1,10 +1,14 @@
-import joblib
 import os
 
-class CaliforniumModel:
+from app.models.joblib_cache import load_joblib
+from app.models.model_wrapper import ModelWrapper
+
+class CaliforniumModel(ModelWrapper):
+    MODEL_NAME = 'Californium'  # Registry key
+
     def __init__(self):
         model_path = os.path.join(os.path.dirname(__file__), 'joblib', 'Californium.joblib')
-        self.model = joblib.load(model_path)
+        self.model = load_joblib(model_path)
 
     def predict(self, features):
         """
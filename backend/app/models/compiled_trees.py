@@ -0,0 +1,237 @@
+# backend/app/models/compiled_trees.py
+
+import numpy as np
+from scipy.special import expit
+
+LEAF = -1  # sklearn's TREE_LEAF child marker
+
+
+class CompiledEnsemble:
+    """
+    Flat-array form of a fitted sklearn tree ensemble.
+
+    All trees are concatenated into one set of node arrays (feature, threshold,
+    children, leaf values). Leaves point at themselves, so every tree can be walked
+    for every row at once in max_depth vectorized steps with no per-call validation.
+    Arithmetic mirrors sklearn (float32 inputs, sequential accumulation over trees),
+    so predict_proba matches the source estimator bit for bit.
+    """
+
+    def __init__(self, kind, feature, threshold, missing_left, left, right, leaf_values, roots,
+                 depth, n_features, classes, init_raw=0.0):
+        self.kind = kind  # "forest" (averaged class probabilities) or "boosting" (binary log-odds)
+        self.feature = feature
+        self.threshold = threshold
+        self.missing_left = missing_left
+        self.left = left
+        self.right = right
+        self.leaf_values = leaf_values
+        self.roots = roots
+        self.depth = depth
+        self.n_features = n_features
+        self.classes = classes
+        self.init_raw = init_raw
+
+    def apply(self, X: np.ndarray, roots: np.ndarray = None) -> np.ndarray:
+        """
+        Leaf node index per (row, tree), or per row when `roots` gives each row its own tree root.
+        """
+        if roots is None:
+            nodes = np.repeat(self.roots[None, :], len(X), axis=0)
+            rows = np.arange(len(X))[:, None]
+        else:
+            nodes = np.asarray(roots, dtype=np.intp)
+            rows = np.arange(len(X))
+        for _ in range(self.depth):
+            values = X[rows, self.feature[nodes]]
+            go_left = values <= self.threshold[nodes]
+            if self.missing_left is not None:
+                go_left |= np.isnan(values) & self.missing_left[nodes]
+            nodes = np.where(go_left, self.left[nodes], self.right[nodes])
+        return nodes
+
+    def predict_proba(self, X) -> np.ndarray:
+        X = np.asarray(X, dtype=np.float32)  # sklearn trees evaluate on float32 inputs
+        if X.ndim == 1:
+            X = X.reshape(1, -1)
+        leaves = self.leaf_values[self.apply(X)]
+
+        # cumsum adds strictly in tree order, like sklearn's accumulation loop
+        if self.kind == "forest":
+            return np.cumsum(leaves, axis=1)[:, -1, :] / len(self.roots)
+
+        stages = np.concatenate([np.full((len(X), 1), self.init_raw), leaves], axis=1)
+        raw = np.cumsum(stages, axis=1)[:, -1]
+        proba = np.empty((len(X), 2))
+        proba[:, 1] = expit(raw)
+        proba[:, 0] = 1 - proba[:, 1]
+        return proba
+
+    def probe_inputs(self):
+        """
+        Verification inputs covering every reachable split: for each split node, rows
+        that follow the path to it and then sit on its threshold and on the nearest
+        float32 values either side (plus a NaN row when missing values are routed).
+        Returns (X, tree) where tree[i] is the tree whose split row i probes.
+        """
+        rows, trees = [], []
+        internal = self.left != np.arange(len(self.left))
+        # DFS carrying the float32 [low, high] interval each feature is confined to on the path
+        stack = [(t, int(root), {}) for t, root in enumerate(self.roots)]
+        while stack:
+            tree, node, bounds = stack.pop()
+            if not internal[node]:
+                continue
+            f = int(self.feature[node])
+            low, high = bounds.get(f, (-np.inf, np.inf))
+            at_or_below = _float32_at_or_below(self.threshold[node])
+            above = np.nextafter(at_or_below, np.float32(np.inf)) if np.isfinite(at_or_below) else at_or_below
+
+            base = np.zeros(self.n_features, dtype=np.float32)
+            for g, (lo, hi) in bounds.items():
+                base[g] = min(max(np.float32(0), lo), hi)
+            probes = [
+                v for v in (np.nextafter(at_or_below, np.float32(-np.inf)), at_or_below, above)
+                if low <= v <= high and np.isfinite(v)
+            ]
+            if self.missing_left is not None:
+                probes.append(np.float32(np.nan))
+            for value in probes:
+                row = base.copy()
+                row[f] = value
+                rows.append(row)
+                trees.append(tree)
+
+            if low <= at_or_below:
+                stack.append((tree, int(self.left[node]), {**bounds, f: (low, min(high, at_or_below))}))
+            if above <= high and np.isfinite(above):  # An infinite threshold sends only NaN right
+                stack.append((tree, int(self.right[node]), {**bounds, f: (max(low, above), high)}))
+
+        if not rows:
+            return np.zeros((1, self.n_features), dtype=np.float32), np.zeros(1, dtype=np.intp)
+        return np.asarray(rows, dtype=np.float32), np.asarray(trees, dtype=np.intp)
+
+
+def _float32_at_or_below(threshold: float) -> np.float32:
+    """
+    Largest float32 that sklearn routes left at this float64 threshold (x <= threshold).
+    """
+    value = np.float32(threshold)
+    return np.nextafter(value, np.float32(-np.inf)) if value > threshold else value
+
+
+def _flatten(trees, leaf_value_fn):
+    """
+    Concatenate sklearn Tree objects into global node arrays with self-looping leaves.
+    """
+    features, thresholds, missing, lefts, rights, values, roots = [], [], [], [], [], [], []
+    offset = 0
+    depth = 0
+    for tree in trees:
+        n = tree.node_count
+        index = np.arange(offset, offset + n)
+        is_leaf = tree.children_left == LEAF
+
+        features.append(np.where(is_leaf, 0, tree.feature).astype(np.intp))
+        thresholds.append(np.where(is_leaf, np.inf, tree.threshold))
+        missing.append(getattr(tree, "missing_go_to_left", np.zeros(n, dtype=bool)).astype(bool) & ~is_leaf)
+        lefts.append(np.where(is_leaf, index, tree.children_left + offset))
+        rights.append(np.where(is_leaf, index, tree.children_right + offset))
+        values.append(leaf_value_fn(tree))
+        roots.append(offset)
+
+        offset += n
+        depth = max(depth, tree.max_depth)
+
+    missing_left = np.concatenate(missing)
+    return dict(
+        feature=np.concatenate(features),
+        threshold=np.concatenate(thresholds),
+        missing_left=missing_left if missing_left.any() else None,
+        left=np.concatenate(lefts),
+        right=np.concatenate(rights),
+        leaf_values=np.concatenate(values),
+        roots=np.asarray(roots, dtype=np.intp),
+        depth=depth,
+    )
+
+
+def compile_estimator(estimator) -> CompiledEnsemble:
+    """
+    Compile a fitted DecisionTreeClassifier, RandomForestClassifier, ExtraTreesClassifier
+    or binary GradientBoostingClassifier. Raises NotImplementedError for anything else.
+    """
+    if type(estimator).__name__ == "GradientBoostingClassifier":
+        return _compile_boosting(estimator)
+    trees = _sklearn_trees(estimator)
+
+    if getattr(estimator, "n_outputs_", 1) != 1:
+        raise NotImplementedError("Multi-output trees are not supported")
+    n_classes = int(estimator.n_classes_)
+
+    def class_probabilities(tree):
+        # Same normalization as DecisionTreeClassifier.predict_proba
+        proba = tree.value[:, 0, :n_classes]
+        normalizer = proba.sum(axis=1)[:, np.newaxis]
+        normalizer[normalizer == 0.0] = 1.0
+        return proba / normalizer
+
+    arrays = _flatten(trees, class_probabilities)
+    return CompiledEnsemble("forest", n_features=estimator.n_features_in_, classes=estimator.classes_, **arrays)
+
+
+def _compile_boosting(estimator) -> CompiledEnsemble:
+    if estimator.estimators_.shape[1] != 1:
+        raise NotImplementedError("Only binary GradientBoostingClassifier is supported")
+
+    # Constant for 'zero' and prior (DummyClassifier) initial estimators
+    probe = np.zeros((2, estimator.n_features_in_), dtype=np.float32)
+    init_raw = estimator._raw_predict_init(probe)[:, 0]
+    if init_raw[0] != init_raw[1]:
+        raise NotImplementedError("Input-dependent init estimators are not supported")
+
+    scale = estimator.learning_rate
+    arrays = _flatten(_sklearn_trees(estimator), lambda tree: scale * tree.value[:, 0, 0])
+    return CompiledEnsemble(
+        "boosting", n_features=estimator.n_features_in_, classes=estimator.classes_,
+        init_raw=float(init_raw[0]), **arrays
+    )
+
+
+def _sklearn_trees(estimator):
+    """
+    The low-level sklearn Tree objects of a supported estimator, in compiled order.
+    """
+    name = type(estimator).__name__
+    if name == "DecisionTreeClassifier":
+        return [estimator.tree_]
+    if name in ("RandomForestClassifier", "ExtraTreesClassifier"):
+        return [t.tree_ for t in estimator.estimators_]
+    if name == "GradientBoostingClassifier":
+        return [t.tree_ for t in estimator.estimators_[:, 0]]
+    raise NotImplementedError(f"Cannot compile {name}")
+
+
+def verify(compiled: CompiledEnsemble, estimator, X=None, proba_rows: int = 2048) -> bool:
+    """
+    True when the compiled evaluator reproduces the estimator exactly.
+
+    Every split is checked: each probe row (see probe_inputs) must reach the same leaf
+    in its tree as sklearn's own Tree.apply. predict_proba is then compared on up to
+    `proba_rows` of the probes (or on X when given) to cover leaf values and accumulation.
+    """
+    if X is not None:
+        X = np.asarray(X, dtype=np.float32)
+        return np.array_equal(compiled.predict_proba(X), estimator.predict_proba(X))
+
+    X, tree_of_row = compiled.probe_inputs()
+    leaves = compiled.apply(X, roots=compiled.roots[tree_of_row]) - compiled.roots[tree_of_row]
+    for t, tree in enumerate(_sklearn_trees(estimator)):
+        rows = tree_of_row == t
+        if rows.any() and not np.array_equal(leaves[rows], tree.apply(X[rows])):
+            return False
+
+    X = X[~np.isnan(X).any(axis=1)]  # Not every estimator's predict_proba accepts NaN
+    if len(X) > proba_rows:
+        X = X[np.linspace(0, len(X) - 1, proba_rows).astype(np.intp)]
+    return np.array_equal(compiled.predict_proba(X), estimator.predict_proba(X))
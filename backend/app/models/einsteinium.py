@@ -1,10 +1,14 @@
-import joblib
 import os
 
-class EinsteiniumModel:
+from app.models.joblib_cache import load_joblib
+from app.models.model_wrapper import ModelWrapper
+
+class EinsteiniumModel(ModelWrapper):
+    MODEL_NAME = 'Einsteinium'  # Registry key
+
     def __init__(self):
         model_path = os.path.join(os.path.dirname(__file__), 'joblib', 'Einsteinium.joblib')
-        self.model = joblib.load(model_path)
+        self.model = load_joblib(model_path)
 
     def predict(self, features):
         """
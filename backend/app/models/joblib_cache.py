@@ -0,0 +1,45 @@
+# backend/app/models/joblib_cache.py
+
+import hashlib
+import threading
+import weakref
+
+import joblib
+
+# content hash -> loaded object, alive only while some model wrapper still holds it
+_loaded = weakref.WeakValueDictionary()
+_strong = {}  # objects that cannot be weakly referenced
+_lock = threading.Lock()
+
+
+def file_hash(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def load_joblib(path: str):
+    """
+    joblib.load that deserializes each distinct file content once; identical files
+    (e.g. copies in two directories) share one object.
+    """
+    key = file_hash(path)
+    with _lock:
+        obj = _loaded.get(key, _strong.get(key))
+        if obj is None:
+            obj = joblib.load(path)
+            try:
+                _loaded[key] = obj
+            except TypeError:
+                _strong[key] = obj
+        return obj
+
+
+def release(path: str):
+    """
+    Drop a strongly cached object (weakly cached ones go away with their last user).
+    """
+    with _lock:
+        _strong.pop(file_hash(path), None)
@@ -1,36 +1,328 @@
 # backend/app/models/model_registry.py
 
-from app.models.alphacoin import AlphacoinModel
-from app.models.antimatter import AntimatterModel
-from app.models.hexacoin import HexacoinModel
-from app.models.dianastone import DianastoneModel
-from app.models.radiant import RadiantModel
-from app.models.cryptanium import CryptaniumModel
-from app.models.cryptomite import CryptomiteModel
-from app.models.einsteinium import EinsteiniumModel
-from app.models.titanfusion import TitanFusionModel
-from app.models.sophiaprimex import SophiaPrimeXModel
-from app.models.californium import CaliforniumModel
+import asyncio
+import importlib
+import logging
+import multiprocessing
+import os
+import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from app.models import joblib_cache
+
+JOBLIB_DIR = os.path.join(os.path.dirname(__file__), 'joblib')
+
+# Resident models are evicted least-recently-used once their estimated size exceeds this
+MODEL_MEMORY_BUDGET_MB = float(os.getenv("MODEL_MEMORY_BUDGET_MB", 512))
+
+# Process-pool inference: worker count (0 keeps inference in-process) and the input
+# size above which feature matrices are passed through shared memory instead of pickled
+MODEL_PROCESS_WORKERS = int(os.getenv("MODEL_PROCESS_WORKERS", 0))
+SHM_MIN_BYTES = 64 * 1024
+
+# Replace sklearn predict_proba with the flat-array tree evaluator when it verifies bit-identical
+COMPILE_TREE_MODELS = os.getenv("COMPILE_TREE_MODELS", "True") == "True"
+
+# name: (type, module, class) — wrappers are only imported when first requested
+MODEL_SPECS = {
+    'Alphacoin': ('crypto', 'app.models.alphacoin', 'AlphacoinModel'),
+    'Antimatter': ('crypto', 'app.models.antimatter', 'AntimatterModel'),
+    'Hexacoin': ('crypto', 'app.models.hexacoin', 'HexacoinModel'),
+    'Radiant': ('crypto', 'app.models.radiant', 'RadiantModel'),
+    'Cryptanium': ('crypto', 'app.models.cryptanium', 'CryptaniumModel'),
+    'Cryptomite': ('crypto', 'app.models.cryptomite', 'CryptomiteModel'),
+    'Einsteinium': ('stock', 'app.models.einsteinium', 'EinsteiniumModel'),
+    'Dianastone': ('stock', 'app.models.dianastone', 'DianastoneModel'),
+    'TitanFusion': ('stock', 'app.models.titanfusion', 'TitanFusionModel'),
+    'SophiaPrimeX': ('stock', 'app.models.sophiaprimex', 'SophiaPrimeXModel'),
+    'Californium': ('stock', 'app.models.californium', 'CaliforniumModel'),
+}
+
+
+class LazyModel:
+    """
+    Placeholder for a model wrapper that is constructed (and its joblib deserialized)
+    on first use.
+    """
+
+    def __init__(self, name, module, class_name):
+        self.name = name
+        self.module = module
+        self.class_name = class_name
+        self.path = os.path.join(JOBLIB_DIR, f'{name}.joblib')
+
+    def load(self):
+        cls = getattr(importlib.import_module(self.module), self.class_name)
+        return cls()
+
+    def content_hash(self):
+        try:
+            return joblib_cache.file_hash(self.path)
+        except OSError:
+            return None
+
+    def estimated_size(self, instance=None):
+        """
+        In-memory size of the loaded estimator, falling back to the on-disk joblib size.
+        """
+        size = estimate_nbytes(getattr(instance, 'model', None)) if instance is not None else 0
+        if size:
+            return size
+        try:
+            return os.path.getsize(self.path)
+        except OSError:
+            return 0
+
+
+def estimate_nbytes(obj) -> int:
+    """
+    Approximate deep size of an object graph: array buffers by nbytes, everything else
+    by sys.getsizeof, following attributes, containers and __getstate__ (sklearn Tree).
+    Shared sub-objects are counted once.
+    """
+    if obj is None:
+        return 0
+    seen = set()
+    stack = [obj]
+    total = 0
+    while stack:
+        item = stack.pop()
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+
+        if isinstance(item, np.ndarray):
+            total += item.nbytes
+            if item.dtype.hasobject:
+                stack.extend(item.ravel())
+            continue
+        total += sys.getsizeof(item, 0)
+        if isinstance(item, (str, bytes, int, float, bool, type)):
+            continue
+
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            stack.extend(item)
+        elif hasattr(item, '__dict__'):
+            stack.append(vars(item))
+        else:
+            try:
+                state = item.__getstate__()
+            except Exception:
+                continue
+            if state is not None and state is not item:
+                stack.append(state)
+    return total
+
 
 class ModelRegistry:
-    def __init__(self):
+    def __init__(self, memory_budget_mb: float = MODEL_MEMORY_BUDGET_MB, compile_trees: bool = COMPILE_TREE_MODELS):
         self.registry = {
-           # 'Alphacoin': {'type': 'crypto', 'instance': AlphacoinModel(), 'performance': {}},
-            'Antimatter': {'type': 'crypto', 'instance': AntimatterModel(), 'performance': {}},
-            'Hexacoin': {'type': 'crypto', 'instance': HexacoinModel(), 'performance': {}},
-            'Radiant': {'type': 'crypto', 'instance': RadiantModel(), 'performance': {}},
-            'Cryptanium': {'type': 'crypto', 'instance': CryptaniumModel(), 'performance': {}},
-            'Cryptomite': {'type': 'crypto', 'instance': CryptomiteModel(), 'performance': {}},
-            'Einsteinium': {'type': 'stock', 'instance': EinsteiniumModel(), 'performance': {}},
-            'Dianastone': {'type': 'stock', 'instance': DianastoneModel(), 'performance': {}},
-            'TitanFusion': {'type': 'stock', 'instance': TitanFusionModel(), 'performance': {}},
-            'SophiaPrimeX': {'type': 'stock', 'instance': SophiaPrimeXModel(), 'performance': {}},
-            'Californium': {'type': 'stock', 'instance': CaliforniumModel(), 'performance': {}},
+            name: {'type': model_type, 'loader': LazyModel(name, module, class_name), 'performance': {}}
+            for name, (model_type, module, class_name) in MODEL_SPECS.items()
         }
+        self.memory_budget = memory_budget_mb * 1024 * 1024
+        self.resident = OrderedDict()  # name -> (instance, size, content hash), least recently used first
+        self.resident_bytes = 0
+        self.lock = threading.RLock()
+        self.process_pool = None
+        self.process_workers = 0
+        self.compile_trees = compile_trees
+        self.compiled = {}  # name -> CompiledEnsemble for resident tree models
+        self.aliases = {name.lower(): name for name in self.registry}
+        self.loaded_digests = {}  # name -> content hash of the last load
+        self.reload_listeners = []  # called with the model name when it reloads with new content
 
     def get_model(self, model_name):
+        """
+        Return the loaded model, loading it on first request. Returns None for unknown
+        models or models whose joblib cannot be loaded.
+        """
         entry = self.registry.get(model_name)
-        return entry['instance'] if entry else None
+        if not entry:
+            return None
+
+        with self.lock:
+            if model_name in self.resident:
+                self.resident.move_to_end(model_name)
+                return self.resident[model_name][0]
+
+            loader = entry['loader']
+            try:
+                instance = loader.load()
+            except Exception as e:
+                logging.error(f"[ModelRegistry] Failed to load {model_name}: {e}")
+                return None
+
+            if self.compile_trees:
+                self.compile_model(model_name, instance)
+
+            size = loader.estimated_size(instance)
+            digest = loader.content_hash()
+            previous = self.loaded_digests.get(model_name)
+            self.loaded_digests[model_name] = digest
+            if previous is not None and previous != digest:
+                for listener in self.reload_listeners:
+                    listener(model_name)
+            # Wrappers over identical joblib content share one estimator; count it once
+            if not self._shared_with(model_name, digest):
+                self.resident_bytes += size
+            self.resident[model_name] = (instance, size, digest)
+            self._evict(keep=model_name)
+            return instance
+
+    def load_model(self, model_name: str):
+        """
+        Case-insensitive get_model for the legacy loader API ("hexacoin", "titanfusion", ...).
+        Returns the same shared instance; raises ValueError for unknown names.
+        """
+        name = self.aliases.get(model_name.lower())
+        if name is None:
+            raise ValueError(f"Unknown model name: {model_name}")
+        return self.get_model(name)
+
+    def unload(self, model_name):
+        with self.lock:
+            if model_name in self.resident:
+                _, size, digest = self.resident.pop(model_name)
+                if not self._shared_with(model_name, digest):
+                    self.resident_bytes -= size
+                    joblib_cache.release(self.registry[model_name]['loader'].path)
+            self.compiled.pop(model_name, None)
+
+    def _shared_with(self, model_name, digest):
+        return [
+            name for name, (_, _, other) in self.resident.items()
+            if name != model_name and digest is not None and other == digest
+        ]
+
+    def _evict(self, keep):
+        while self.resident_bytes > self.memory_budget and len(self.resident) > 1:
+            name = next(iter(self.resident))
+            if name == keep:
+                break
+            self.unload(name)
+            logging.info(f"[ModelRegistry] Evicted {name} to stay within the model memory budget")
+
+    # ----------------------
+    # Inference
+    # ----------------------
+    def compile_model(self, model_name, instance):
+        """
+        Export a tree-ensemble model to flat arrays, keeping it only if it routes every
+        split as sklearn does and reproduces predict_proba exactly (see verify).
+        """
+        from app.models.compiled_trees import compile_estimator, verify
+
+        try:
+            compiled = compile_estimator(instance.model)
+            if not verify(compiled, instance.model):
+                logging.warning(f"[ModelRegistry] Compiled {model_name} diverges from predict_proba; not used")
+                return None
+        except Exception as e:
+            logging.info(f"[ModelRegistry] {model_name} stays on predict_proba: {e}")
+            return None
+
+        self.compiled[model_name] = compiled
+        return compiled
+
+    def predict_batch(self, model_name, features):
+        """
+        Positive-class probabilities for a 2D feature matrix, scored in this process
+        (on the compiled trees when the model verified). ModelWrapper.predict_async
+        reaches it through InferenceService and predict_async.
+        """
+        wrapper = self.get_model(model_name)
+        if wrapper is None:
+            raise ValueError(f"Model {model_name} is not available")
+        compiled = self.compiled.get(model_name)
+        if compiled is not None:
+            return compiled.predict_proba(features)[:, 1]
+        return wrapper.model.predict_proba(features)[:, 1]
+
+    def enable_process_pool(self, workers: int = MODEL_PROCESS_WORKERS):
+        """
+        Host inference in worker processes; each worker lazily loads its own model copies.
+        """
+        if self.process_pool is None and workers > 0:
+            self.process_workers = workers
+            self.process_pool = ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+            )
+
+    def shutdown_process_pool(self):
+        if self.process_pool is not None:
+            self.process_pool.shutdown(wait=False, cancel_futures=True)
+            self.process_pool = None
+
+    async def predict_async(self, model_name, features):
+        """
+        Async predict_batch. With a process pool the scoring runs off the event loop,
+        large inputs travelling through shared memory; otherwise it runs inline.
+        A pool broken by a dead worker is replaced and the batch is scored inline.
+        """
+        features = np.ascontiguousarray(features, dtype=float)
+        if features.ndim == 1:
+            features = features.reshape(1, -1)
+        if self.process_pool is None:
+            return self.predict_batch(model_name, features)
+
+        try:
+            return await self._predict_in_pool(model_name, features)
+        except BrokenProcessPool as e:
+            logging.error(f"[ModelRegistry] Process pool broke scoring {model_name} ({e}); restarting it")
+            workers = self.process_workers
+            self.shutdown_process_pool()
+            self.enable_process_pool(workers)
+            return self.predict_batch(model_name, features)
+
+    async def _predict_in_pool(self, model_name, features):
+        loop = asyncio.get_running_loop()
+        if features.nbytes < SHM_MIN_BYTES:
+            return await loop.run_in_executor(self.process_pool, _worker_predict, model_name, features)
+
+        shm = shared_memory.SharedMemory(create=True, size=features.nbytes)
+        try:
+            np.ndarray(features.shape, dtype=features.dtype, buffer=shm.buf)[:] = features
+            return await loop.run_in_executor(
+                self.process_pool, _worker_predict_shared, model_name, shm.name, features.shape, features.dtype.str
+            )
+        finally:
+            shm.close()
+            shm.unlink()
+
+    def is_loaded(self, model_name):
+        return model_name in self.resident
+
+    def memory_report(self):
+        """
+        Estimated resident memory per loaded model (estimator plus compiled arrays).
+        """
+        with self.lock:
+            models = {}
+            for name, (_, size, digest) in self.resident.items():
+                compiled = self.compiled.get(name)
+                compiled_bytes = estimate_nbytes(vars(compiled)) if compiled is not None else 0
+                models[name] = {
+                    'type': self.registry[name]['type'],
+                    'model_bytes': size,
+                    'compiled_bytes': compiled_bytes,
+                    'content_hash': digest,
+                    'shared_with': self._shared_with(name, digest),
+                }
+            return {
+                'models': models,
+                'resident_bytes': self.resident_bytes + sum(m['compiled_bytes'] for m in models.values()),
+                'budget_bytes': int(self.memory_budget),
+            }
 
     def list_models(self, model_type=None):
         if model_type:
@@ -58,5 +350,23 @@ class ModelRegistry:
             return self.get_model('Dianastone')
         return None
 
+# ----------------------
+# Process-pool workers (use the worker process's own _model_registry)
+# ----------------------
+def _worker_predict(model_name, features):
+    return _model_registry.predict_batch(model_name, features)
+
+
+def _worker_predict_shared(model_name, shm_name, shape, dtype):
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        features = np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)
+        result = _model_registry.predict_batch(model_name, features)
+        del features  # Release the buffer view before closing
+        return result
+    finally:
+        shm.close()
+
 _model_registry = ModelRegistry()
 get_default_model = _model_registry.get_default_model
+load_model = _model_registry.load_model
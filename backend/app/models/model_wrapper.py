@@ -0,0 +1,20 @@
+# backend/app/models/model_wrapper.py
+
+from app.services.inference_service import inference_service
+
+
+class ModelWrapper:
+    """
+    Base for the joblib-backed model wrappers. Subclasses load their estimator into
+    `self.model` and set MODEL_NAME to their ModelRegistry key.
+    """
+
+    MODEL_NAME = None
+
+    async def predict_async(self, features):
+        """
+        Confidence for one feature vector through the shared InferenceService: scored in
+        one predict_proba with concurrent callers (compiled trees / process pool when
+        enabled), repeats answered from its prediction cache. Raises if scoring fails.
+        """
+        return await inference_service.predict(self.MODEL_NAME, features)
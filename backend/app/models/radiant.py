@@ -1,12 +1,16 @@
 # backend/app/models/radiant.py
 
-import joblib
 import os
 
-class RadiantModel:
+from app.models.joblib_cache import load_joblib
+from app.models.model_wrapper import ModelWrapper
+
+class RadiantModel(ModelWrapper):
+    MODEL_NAME = 'Radiant'  # Registry key
+
     def __init__(self):
         model_path = os.path.join(os.path.dirname(__file__), 'joblib', 'Radiant.joblib')
-        self.model = joblib.load(model_path)
+        self.model = load_joblib(model_path)
 
     def predict(self, features):
         """
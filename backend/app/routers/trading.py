@@ -5,38 +5,30 @@ from app.engines.strategy_engine.strategy_manager import StrategyManager
 from app.engines.forecast_engine.forecast_engine import ForecastEngine
 from app.engines.risk_engine.risk_manager import RiskManager
 from app.engines.auto_close_engine.auto_close import AutoCloseEngine
+from app.engines.auto_close_engine.price_snapshot import PriceSnapshot
 from app.engines.trade_tracking.trade_logger import TradeLogger
 from app.services.websocket_service import WebSocketService
 
-import asyncio
-import httpx
+import numpy as np
 
 
 class TradingSystem:
-    def __init__(self, broker_client, model, strategy_priority):
+    def __init__(self, broker_client, model, strategy_priority, market_data_hub=None):
         self.broker_client = broker_client
+        self.market_data_hub = market_data_hub
         self.model = model
         self.discovery_engine = CryptoDiscoveryEngine(broker_client)
         self.strategy_manager = StrategyManager(strategy_priority)
         self.forecast_engine = ForecastEngine({"mode": "easy"})
         self.risk_manager = RiskManager()
         self.auto_close_engine = AutoCloseEngine(broker_client)
-        self.trade_logger = TradeLogger(db_session=None)  # Inject real session if needed
+        self.price_snapshot = PriceSnapshot(broker_client, market_data_hub)
+        self.trade_logger = TradeLogger()
         self.executed_symbols = set()
 
-    async def safe_broker_call(self, method, *args, retries=5, **kwargs):
-        for attempt in range(retries):
-            try:
-                return await getattr(self.broker_client, method)(*args, **kwargs)
-            except httpx.HTTPStatusError as e:
-                if e.response.status_code == 429:
-                    await asyncio.sleep(2 ** attempt)
-                else:
-                    raise
-            except Exception as e:
-                if attempt == retries - 1:
-                    raise e
-                await asyncio.sleep(2 ** attempt)
+    async def safe_broker_call(self, method, *args, **kwargs):
+        # RateLimiter paces calls and the client retries a 429 once; don't stack another retry loop
+        return await getattr(self.broker_client, method)(*args, **kwargs)
 
     async def scan_and_trade(self):
         try:
@@ -51,18 +43,35 @@ class TradingSystem:
             await self.trade_logger.log_account_error(str(e))
             return
 
+        # Stream quotes for everything discovered or already traded
+        if self.market_data_hub:
+            try:
+                await self.market_data_hub.sync_symbols(
+                    account_data.get("broker_id", "unknown"), symbols, self.executed_symbols
+                )
+            except Exception as e:
+                print(f"[TradingSystem] Market data subscription failed: {e}")
+
         if not self.risk_manager.check_margin_floor(account_data):
             await self.trade_logger.log_margin_floor(account_data)
             return
 
-        for symbol in symbols:
-            if symbol in self.executed_symbols:
-                continue
+        symbols = [s for s in symbols if s not in self.executed_symbols]
+        if not symbols:
+            return
+
+        # Score the whole universe in one vectorized pass
+        n_symbols = len(symbols)
+        forecasts = self.forecast_engine.forecast_batch(
+            highs=np.full((n_symbols, 20), 1.0),
+            lows=np.full((n_symbols, 20), 0.95),
+            closes=np.full((n_symbols, 20), 0.98),
+            breakout_velocity=np.full(n_symbols, 0.03)
+        )
 
+        for i, symbol in enumerate(symbols):
             try:
-                forecast = self.forecast_engine.forecast(
-                    highs=[1.0] * 20, lows=[0.95] * 20, closes=[0.98] * 20, breakout_velocity=0.03
-                )
+                forecast = {key: float(values[i]) for key, values in forecasts.items()}
 
                 if forecast.get("confidence", 0) < 0.95:
                     continue
@@ -116,8 +125,9 @@ class TradingSystem:
             await self.trade_logger.log_monitor_error("Open Trades Fetch", str(e))
             return
 
+        await self.price_snapshot.refresh(open_trades)
         for trade in open_trades:
             try:
-                await self.auto_close_engine.evaluate_trade(trade)
+                await self.auto_close_engine.evaluate_trade(trade, self.price_snapshot.get(trade["symbol"]))
             except Exception as e:
                 await self.trade_logger.log_monitor_error(trade.get("symbol", "N/A"), str(e))
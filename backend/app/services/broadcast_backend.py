@@ -0,0 +1,149 @@
+# backend/app/services/broadcast_backend.py
+
+import asyncio
+import json
+import logging
+from typing import Awaitable, Callable, Dict, Optional, Union
+
+from app.services.fanout import Fanout, encode_message
+
+try:
+    import redis.asyncio as aioredis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+# handler(topic, data) invoked for every message published by any process
+MessageHandler = Callable[[str, str], Awaitable[None]]
+
+
+class MemoryBackend:
+    """
+    In-process stand-in for a pub/sub server: every publish is delivered straight back
+    to this process's handler. Used for single-worker runs and tests.
+    """
+
+    def __init__(self):
+        self.handler: Optional[MessageHandler] = None
+
+    async def start(self, handler: MessageHandler):
+        self.handler = handler
+
+    async def stop(self):
+        self.handler = None
+
+    async def publish(self, topic: str, data: str):
+        if self.handler:
+            await self.handler(topic, data)
+
+
+class RedisBackend:
+    """
+    Redis pub/sub: publishes to `<prefix>:<topic>` and pattern-subscribes to `<prefix>:*`,
+    so every API worker or replica receives every message, its own included.
+    """
+
+    def __init__(self, url: str, prefix: str, reconnect_backoff_max: float = 30.0):
+        if not REDIS_AVAILABLE:
+            raise RuntimeError("redis is not installed; use the memory broadcast backend")
+        self.url = url
+        self.prefix = prefix
+        self.reconnect_backoff_max = reconnect_backoff_max
+        self.redis = None
+        self.listener: Optional[asyncio.Task] = None
+
+    async def start(self, handler: MessageHandler):
+        self.redis = aioredis.from_url(self.url, decode_responses=True)
+        self.listener = asyncio.create_task(self._listen(handler))
+
+    async def stop(self):
+        if self.listener:
+            self.listener.cancel()
+            await asyncio.gather(self.listener, return_exceptions=True)
+            self.listener = None
+        if self.redis:
+            await self.redis.aclose()
+            self.redis = None
+
+    async def publish(self, topic: str, data: str):
+        await self.redis.publish(f"{self.prefix}:{topic}", data)
+
+    async def _listen(self, handler: MessageHandler):
+        strip = len(self.prefix) + 1
+        backoff = 1.0
+        while True:
+            try:
+                async with self.redis.pubsub() as pubsub:
+                    await pubsub.psubscribe(f"{self.prefix}:*")
+                    backoff = 1.0
+                    async for message in pubsub.listen():
+                        if message["type"] == "pmessage":
+                            await handler(message["channel"][strip:], message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logging.warning(f"[BroadcastBus] Redis subscription dropped: {e}")
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, self.reconnect_backoff_max)
+
+
+class BroadcastBus:
+    """
+    Routes Fanout publishes through a pub/sub backend so that clients connected to any
+    worker see every event. A message travels on the topic `<fanout>` as a JSON
+    [channel, payload] pair, so channels must be JSON scalars (str, int, None); each
+    worker delivers it to its local Fanout of that name.
+    """
+
+    def __init__(self, backend=None):
+        self.backend = backend or MemoryBackend()
+        self.fanouts: Dict[str, Fanout] = {}
+        self.started = False
+
+    def register(self, fanout: Fanout):
+        self.fanouts[fanout.name] = fanout
+
+    async def start(self, backend=None):
+        if backend is not None:
+            self.backend = backend
+        await self.backend.start(self._deliver)
+        self.started = True
+
+    async def stop(self):
+        self.started = False
+        await self.backend.stop()
+
+    async def publish(self, fanout: Fanout, message, channel: Union[str, int, None] = None):
+        if channel is not None and not isinstance(channel, (str, int)):
+            raise TypeError(f"Broadcast channels must be str or int, not {type(channel).__name__}")
+        data = encode_message(message)
+        if not self.started:
+            fanout.publish(data, channel)
+            return
+
+        self.fanouts.setdefault(fanout.name, fanout)
+        try:
+            await self.backend.publish(fanout.name, json.dumps([channel, data]))
+        except Exception as e:
+            # Keep this worker's own clients up to date while the backend is unavailable
+            logging.warning(f"[BroadcastBus] Publish failed, delivering locally only: {e}")
+            fanout.publish(data, channel)
+
+    async def _deliver(self, topic: str, envelope: str):
+        fanout = self.fanouts.get(topic)
+        if fanout is not None:
+            channel, data = json.loads(envelope)
+            fanout.publish(data, channel)
+
+
+def create_backend(kind: Optional[str] = None):
+    # Settings are read here, not at import, so the service layer never imports app.core
+    from app.core.config import settings
+
+    kind = kind or settings.BROADCAST_BACKEND
+    if kind == "redis":
+        return RedisBackend(settings.REDIS_URL, settings.WEBSOCKET_BROKER_CHANNEL)
+    return MemoryBackend()
+
+
+broadcast_bus = BroadcastBus()
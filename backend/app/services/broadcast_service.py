@@ -1,34 +1,31 @@
 # backend/app/services/broadcast_service.py
 
-from typing import List, Dict
+from typing import Dict
 from fastapi import WebSocket
 import logging
 
+from app.services.fanout import Fanout
+from app.services.broadcast_backend import broadcast_bus
+
 logger = logging.getLogger(__name__)
 
 class BroadcastService:
-    connections: List[WebSocket] = []
+    fanout = Fanout("Broadcast")
 
     @classmethod
     async def register(cls, websocket: WebSocket):
         await websocket.accept()
-        cls.connections.append(websocket)
-        logger.info(f"[Broadcast] WebSocket connected. Total: {len(cls.connections)}")
+        cls.fanout.add(websocket)
+        logger.info(f"[Broadcast] WebSocket connected. Total: {len(cls.fanout)}")
 
     @classmethod
     async def unregister(cls, websocket: WebSocket):
-        if websocket in cls.connections:
-            cls.connections.remove(websocket)
-            logger.info(f"[Broadcast] WebSocket disconnected. Total: {len(cls.connections)}")
+        cls.fanout.remove(websocket)
+        logger.info(f"[Broadcast] WebSocket disconnected. Total: {len(cls.fanout)}")
 
     @classmethod
     async def send_message(cls, message: Dict):
-        for ws in cls.connections.copy():
-            try:
-                await ws.send_json(message)
-            except Exception as e:
-                logger.warning(f"[Broadcast] Error sending message: {e}")
-                await cls.unregister(ws)
+        await broadcast_bus.publish(cls.fanout, message)
 
     # ----------------------
     # Predefined Events
@@ -72,3 +69,6 @@ class BroadcastService:
             "text": text,
             "sound": sound
         })
+
+
+broadcast_bus.register(BroadcastService.fanout)
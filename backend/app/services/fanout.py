@@ -0,0 +1,130 @@
+# backend/app/services/fanout.py
+
+import asyncio
+import json
+import logging
+from typing import Dict, Hashable, Optional, Set
+
+from fastapi import WebSocket
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def encode_message(message) -> str:
+    """
+    Serialize a message once for every recipient (orjson when installed).
+    """
+    if isinstance(message, str):
+        return message
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(message, default=str).decode()
+    return json.dumps(message, separators=(",", ":"), default=str)
+
+
+# What to do when a client's send queue is full
+SLOW_CONSUMER_POLICIES = ("drop_oldest", "drop_newest", "disconnect")
+
+
+class _Connection:
+    __slots__ = ("websocket", "channel", "queue", "writer", "dropped")
+
+    def __init__(self, websocket: WebSocket, channel: Hashable, max_queue: int):
+        self.websocket = websocket
+        self.channel = channel
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue)
+        self.writer: Optional[asyncio.Task] = None
+        self.dropped = 0
+
+
+class Fanout:
+    """
+    WebSocket fan-out: publish() encodes a message once and enqueues it on every
+    subscriber's bounded queue without awaiting, and a writer task per connection
+    drains its own queue. A slow client only ever delays itself; when its queue
+    fills, `slow_policy` drops its oldest or newest message or disconnects it.
+    """
+
+    def __init__(self, name: str, max_queue: int = 256, slow_policy: str = "drop_oldest",
+                 send_timeout: float = 5.0):
+        if slow_policy not in SLOW_CONSUMER_POLICIES:
+            raise ValueError(f"Unknown slow consumer policy: {slow_policy}")
+        self.name = name
+        self.max_queue = max_queue
+        self.slow_policy = slow_policy
+        self.send_timeout = send_timeout
+        self.channels: Dict[Hashable, Set[_Connection]] = {}
+        self.by_socket: Dict[WebSocket, _Connection] = {}
+
+    def add(self, websocket: WebSocket, channel: Hashable = None) -> _Connection:
+        self.remove(websocket)
+        conn = _Connection(websocket, channel, self.max_queue)
+        conn.writer = asyncio.create_task(self._writer(conn))
+        self.channels.setdefault(channel, set()).add(conn)
+        self.by_socket[websocket] = conn
+        return conn
+
+    def remove(self, websocket: WebSocket):
+        conn = self.by_socket.pop(websocket, None)
+        if not conn:
+            return
+        subscribers = self.channels.get(conn.channel)
+        if subscribers is not None:
+            subscribers.discard(conn)
+            if not subscribers:
+                del self.channels[conn.channel]
+        if conn.writer and conn.writer is not asyncio.current_task():
+            conn.writer.cancel()
+
+    def publish(self, message, channel: Hashable = None) -> int:
+        """
+        Queue a message for every connection on a channel. Returns the number of recipients.
+        """
+        subscribers = self.channels.get(channel)
+        if not subscribers:
+            return 0
+
+        data = encode_message(message)
+        recipients = len(subscribers)
+        slow = []
+        for conn in subscribers:
+            try:
+                conn.queue.put_nowait(data)
+            except asyncio.QueueFull:
+                conn.dropped += 1
+                if self.slow_policy == "drop_oldest":
+                    conn.queue.get_nowait()
+                    conn.queue.put_nowait(data)
+                elif self.slow_policy == "disconnect":
+                    slow.append(conn)
+
+        for conn in slow:
+            logging.warning(f"[{self.name}] Disconnecting slow consumer after {conn.dropped} dropped messages")
+            self.remove(conn.websocket)
+            asyncio.create_task(self._close(conn.websocket))
+        return recipients - len(slow)
+
+    async def _writer(self, conn: _Connection):
+        try:
+            while True:
+                data = await conn.queue.get()
+                async with asyncio.timeout(self.send_timeout):
+                    await conn.websocket.send_text(data)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logging.warning(f"[{self.name}] Failed to send WebSocket message: {e}")
+            self.remove(conn.websocket)
+
+    @staticmethod
+    async def _close(websocket: WebSocket):
+        try:
+            await websocket.close(code=1008)
+        except Exception:
+            pass
+
+    def __len__(self):
+        return len(self.by_socket)
@@ -0,0 +1,104 @@
+# backend/app/services/inference_service.py
+
+import asyncio
+import logging
+from typing import Dict, List, Sequence
+
+import numpy as np
+
+from app.models.model_registry import _model_registry
+from app.services.prediction_cache import PredictionCache
+
+
+class _PendingBatch:
+    __slots__ = ("rows", "keys", "futures", "timer")
+
+    def __init__(self):
+        self.rows: List[Sequence[float]] = []
+        self.keys: List[tuple] = []
+        self.futures: List[asyncio.Future] = []
+        self.timer = None
+
+
+class InferenceService:
+    """
+    Micro-batching front end for model scoring.
+
+    Concurrent predict() calls for the same model are collected for up to `max_delay`
+    seconds (or until `max_batch` rows are waiting) and scored with a single
+    predict_proba over the stacked feature matrix; each caller gets its own row back.
+    Recently scored (quantized) feature vectors are answered from `cache` without inference.
+    """
+
+    def __init__(self, registry=None, max_batch: int = 256, max_delay: float = 0.005,
+                 cache: PredictionCache = None):
+        self.registry = registry or _model_registry
+        self.cache = cache or PredictionCache()
+        # A retrained joblib must not keep serving the old model's cached scores
+        self.registry.reload_listeners.append(self.cache.invalidate)
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.pending: Dict[str, _PendingBatch] = {}
+
+    async def predict(self, model_name: str, features: Sequence[float]) -> float:
+        """
+        Confidence (positive-class probability) for one feature vector. Raises the
+        scoring error when the batch it joined fails.
+        """
+        key = self.cache.key(model_name, features)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+
+        future = asyncio.get_running_loop().create_future()
+        batch = self.pending.get(model_name)
+        if batch is None:
+            batch = self.pending[model_name] = _PendingBatch()
+            batch.timer = asyncio.get_running_loop().call_later(self.max_delay, self._flush, model_name)
+
+        batch.rows.append(features)
+        batch.keys.append(key)
+        batch.futures.append(future)
+        if len(batch.rows) >= self.max_batch:
+            self._flush(model_name)
+        return await future
+
+    async def predict_many(self, model_name: str, rows: Sequence[Sequence[float]]) -> List[float]:
+        """
+        Score a whole universe at once; joins any batch already collecting for the model.
+        """
+        return list(await asyncio.gather(*(self.predict(model_name, row) for row in rows)))
+
+    def _flush(self, model_name: str):
+        batch = self.pending.pop(model_name, None)
+        if batch is None:
+            return
+        batch.timer.cancel()
+        asyncio.ensure_future(self._run(model_name, batch))
+
+    async def _run(self, model_name: str, batch: _PendingBatch):
+        try:
+            confidences = await self.score(model_name, np.asarray(batch.rows, dtype=float))
+        except Exception as e:
+            logging.error(f"[InferenceService] {model_name} batch of {len(batch.rows)} failed: {e}")
+            # Callers must be able to tell a scoring failure from a low-confidence score
+            for future in batch.futures:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for key, confidence in zip(batch.keys, confidences):
+            self.cache.set(key, float(confidence))
+
+        for future, confidence in zip(batch.futures, confidences):
+            if not future.done():
+                future.set_result(float(confidence))
+
+    async def score(self, model_name: str, features: np.ndarray) -> np.ndarray:
+        """
+        One predict_proba call over a 2D feature matrix (in the registry's process pool when enabled).
+        """
+        return await self.registry.predict_async(model_name, features)
+
+
+inference_service = InferenceService()
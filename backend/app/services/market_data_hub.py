@@ -0,0 +1,217 @@
+# backend/app/services/market_data_hub.py
+
+import asyncio
+import json
+import logging
+import time
+from typing import Awaitable, Callable, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+import websockets
+
+
+class Quote(NamedTuple):
+    symbol: str
+    price: float
+    bid: float
+    ask: float
+    timestamp: float
+    broker: str
+
+
+QuoteCallback = Callable[[Quote], Awaitable[None]]
+
+
+class _BrokerFeed:
+    def __init__(self, broker_id: str, client):
+        self.broker_id = broker_id
+        self.client = client
+        self.symbols: Set[str] = set()
+        self.ws = None
+        self.task: Optional[asyncio.Task] = None
+
+
+class _Dispatcher:
+    """
+    Delivers quotes to one subscriber from a bounded queue, so a slow callback never
+    stalls the feed's read loop. When the queue is full the oldest quote is dropped.
+    """
+
+    def __init__(self, callback: QuoteCallback, max_queue: int):
+        self.callback = callback
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue)
+        self.task: Optional[asyncio.Task] = None
+        self.dropped = 0
+
+    def put(self, quote: Quote):
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.dropped += 1
+        self.queue.put_nowait(quote)
+        if self.task is None or self.task.done():
+            self.task = asyncio.create_task(self._run())
+
+    async def _run(self):
+        while True:
+            quote = await self.queue.get()
+            try:
+                await self.callback(quote)
+            except Exception as e:
+                logging.warning(f"[MarketDataHub] Subscriber error on {quote.symbol}: {e}")
+
+    def cancel(self):
+        if self.task:
+            self.task.cancel()
+            self.task = None
+
+
+class MarketDataHub:
+    """
+    Owns the broker market-data websockets and fans normalized Quotes out to subscribers.
+
+    A broker client can stream through the hub if it exposes WS_MARKET_URI,
+    ws_subscribe_messages(symbols), ws_unsubscribe_messages(symbols) and
+    parse_ws_ticker(message) -> (symbol, last, bid, ask) | None.
+    """
+
+    def __init__(self, reconnect_backoff_max: float = 30.0, subscriber_queue: int = 1000):
+        self.feeds: Dict[str, _BrokerFeed] = {}
+        self.subscribers: Dict[str, List[QuoteCallback]] = {}
+        self.global_subscribers: List[QuoteCallback] = []
+        self.dispatchers: Dict[QuoteCallback, _Dispatcher] = {}
+        self.latest: Dict[Tuple[str, str], Quote] = {}  # (broker_id, symbol) -> quote
+        self.latest_any: Dict[str, Quote] = {}  # symbol -> most recent quote from any broker
+        self.reconnect_backoff_max = reconnect_backoff_max
+        self.subscriber_queue = subscriber_queue
+        self.running = False
+
+    # ----------------------
+    # Feeds
+    # ----------------------
+    def add_broker(self, broker_id: str, client):
+        if broker_id not in self.feeds:
+            self.feeds[broker_id] = _BrokerFeed(broker_id, client)
+            if self.running:
+                self.feeds[broker_id].task = asyncio.create_task(self._run_feed(self.feeds[broker_id]))
+
+    async def set_symbols(self, broker_id: str, symbols: Iterable[str]):
+        """
+        Replace a broker's subscription set, sending only the subscribe/unsubscribe diff.
+        """
+        feed = self.feeds.get(broker_id)
+        if not feed:
+            raise ValueError(f"Broker {broker_id} has no market data feed")
+
+        wanted = set(symbols)
+        added = sorted(wanted - feed.symbols)
+        removed = sorted(feed.symbols - wanted)
+        feed.symbols = wanted
+
+        if feed.ws is None:
+            return  # Applied on the next (re)connect
+        try:
+            if removed:
+                for message in feed.client.ws_unsubscribe_messages(removed):
+                    await feed.ws.send(json.dumps(message))
+            if added:
+                for message in feed.client.ws_subscribe_messages(added):
+                    await feed.ws.send(json.dumps(message))
+        except Exception as e:
+            logging.warning(f"[MarketDataHub] Subscription update failed for {broker_id}: {e}")
+
+    async def sync_symbols(self, broker_id: str, discovered: Iterable[str], held: Iterable[str]):
+        """
+        Subscribe a broker feed to everything currently discovered or held.
+        """
+        await self.set_symbols(broker_id, set(discovered) | set(held))
+
+    async def start(self):
+        self.running = True
+        for feed in self.feeds.values():
+            if feed.task is None or feed.task.done():
+                feed.task = asyncio.create_task(self._run_feed(feed))
+
+    async def stop(self):
+        self.running = False
+        for feed in self.feeds.values():
+            if feed.task:
+                feed.task.cancel()
+        await asyncio.gather(*(f.task for f in self.feeds.values() if f.task), return_exceptions=True)
+        for feed in self.feeds.values():
+            feed.task = None
+        for dispatcher in self.dispatchers.values():
+            dispatcher.cancel()
+
+    async def _run_feed(self, feed: _BrokerFeed):
+        backoff = 1.0
+        while self.running:
+            try:
+                async with websockets.connect(feed.client.WS_MARKET_URI) as ws:
+                    feed.ws = ws
+                    if feed.symbols:
+                        for message in feed.client.ws_subscribe_messages(sorted(feed.symbols)):
+                            await ws.send(json.dumps(message))
+                    backoff = 1.0
+                    async for raw in ws:
+                        parsed = feed.client.parse_ws_ticker(json.loads(raw))
+                        if parsed:
+                            symbol, price, bid, ask = parsed
+                            await self.publish(Quote(symbol, price, bid, ask, time.time(), feed.broker_id))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logging.warning(f"[MarketDataHub] {feed.broker_id} feed dropped: {e}")
+            finally:
+                feed.ws = None
+
+            if self.running:
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, self.reconnect_backoff_max)
+
+    # ----------------------
+    # Subscribers
+    # ----------------------
+    def subscribe(self, callback: QuoteCallback, symbols: Optional[Iterable[str]] = None):
+        """
+        Register an async callback for quotes on the given symbols (all symbols if None).
+        """
+        if symbols is None:
+            self.global_subscribers.append(callback)
+            return
+        for symbol in symbols:
+            self.subscribers.setdefault(symbol, []).append(callback)
+
+    def unsubscribe(self, callback: QuoteCallback):
+        dispatcher = self.dispatchers.pop(callback, None)
+        if dispatcher:
+            dispatcher.cancel()
+        if callback in self.global_subscribers:
+            self.global_subscribers.remove(callback)
+        for symbol in list(self.subscribers):
+            self.subscribers[symbol] = [cb for cb in self.subscribers[symbol] if cb != callback]
+            if not self.subscribers[symbol]:
+                del self.subscribers[symbol]
+
+    async def publish(self, quote: Quote):
+        """
+        Record the quote and queue it for each interested subscriber; never waits on a callback.
+        """
+        self.latest[(quote.broker, quote.symbol)] = quote
+        self.latest_any[quote.symbol] = quote
+        for callback in self.global_subscribers + self.subscribers.get(quote.symbol, []):
+            dispatcher = self.dispatchers.get(callback)
+            if dispatcher is None:
+                dispatcher = self.dispatchers[callback] = _Dispatcher(callback, self.subscriber_queue)
+            dispatcher.put(quote)
+
+    def get_quote(self, symbol: str, max_age: Optional[float] = None, broker_id: Optional[str] = None) -> Optional[Quote]:
+        """
+        Latest streamed quote for a symbol from broker_id (from any broker if None),
+        or None if missing or older than max_age seconds.
+        """
+        quote = self.latest.get((broker_id, symbol)) if broker_id else self.latest_any.get(symbol)
+        if quote and max_age is not None and time.time() - quote.timestamp > max_age:
+            return None
+        return quote
+
+
+market_data_hub = MarketDataHub()
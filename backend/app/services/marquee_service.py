@@ -1,26 +1,28 @@
 # backend/app/services/marquee_service.py
 
-from typing import List, Dict, Union
+from typing import Dict, Union
 from fastapi import WebSocket
 import logging
 
+from app.services.fanout import Fanout
+from app.services.broadcast_backend import broadcast_bus
+
 class MarqueeService:
-    connections: List[WebSocket] = []
+    fanout = Fanout("MarqueeService")
 
     @classmethod
     async def connect(cls, websocket: WebSocket):
         try:
             await websocket.accept()
-            cls.connections.append(websocket)
+            cls.fanout.add(websocket)
             logging.info("[MarqueeService] Client connected.")
         except Exception as e:
             logging.error(f"[MarqueeService] WebSocket accept failed: {e}")
 
     @classmethod
     def disconnect(cls, websocket: WebSocket):
-        if websocket in cls.connections:
-            cls.connections.remove(websocket)
-            logging.info("[MarqueeService] Client disconnected.")
+        cls.fanout.remove(websocket)
+        logging.info("[MarqueeService] Client disconnected.")
 
     @classmethod
     async def broadcast(cls, message: Union[str, Dict]):
@@ -29,14 +31,7 @@ class MarqueeService:
         {"text": "...", "sound": "file.mp3"}
         """
         payload = {"text": message} if isinstance(message, str) else message
-        stale_connections = []
+        await broadcast_bus.publish(cls.fanout, payload)
 
-        for ws in cls.connections:
-            try:
-                await ws.send_json(payload)
-            except Exception as e:
-                stale_connections.append(ws)
-                logging.warning(f"[MarqueeService] Failed to send message: {e}")
 
-        for ws in stale_connections:
-            cls.disconnect(ws)
+broadcast_bus.register(MarqueeService.fanout)
@@ -0,0 +1,68 @@
+# backend/app/services/prediction_cache.py
+
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Hashable, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+class PredictionCache:
+    """
+    LRU memo of model confidences keyed on (model, quantized feature vector).
+
+    Features are rounded to `mantissa_bits` of relative precision before hashing, so
+    re-scoring a symbol with identical or near-identical inputs within `ttl` seconds
+    (discovery, then the executor, then the auto-close re-check) skips inference.
+    """
+
+    def __init__(self, ttl: float = 10.0, max_entries: int = 10_000, mantissa_bits: int = 16):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.mantissa_bits = mantissa_bits
+        self.entries: "OrderedDict[Hashable, Tuple[float, float]]" = OrderedDict()  # key -> (confidence, expires_at)
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, model_name: str, features: Sequence[float]) -> Tuple[str, bytes]:
+        mantissa, exponent = np.frexp(np.asarray(features, dtype=float))
+        scale = float(1 << self.mantissa_bits)
+        quantized = np.ldexp(np.round(mantissa * scale) / scale, exponent)
+        return model_name, hashlib.blake2b(quantized.tobytes(), digest_size=16).digest()
+
+    def get(self, key) -> Optional[float]:
+        entry = self.entries.get(key)
+        if entry is None or entry[1] < time.monotonic():
+            if entry is not None:
+                del self.entries[key]
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def set(self, key, confidence: float):
+        self.entries[key] = (confidence, time.monotonic() + self.ttl)
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    def invalidate(self, model_name: Optional[str] = None):
+        """
+        Drop cached predictions for one model (e.g. after a reload), or all of them.
+        """
+        if model_name is None:
+            self.entries.clear()
+            return
+        for key in [k for k in self.entries if k[0] == model_name]:
+            del self.entries[key]
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "entries": len(self.entries),
+        }
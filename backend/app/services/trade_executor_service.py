@@ -2,8 +2,6 @@
 
 from datetime import datetime
 from typing import Dict, Any
-import asyncio
-import httpx
 
 from app.engines.execution_engine.trade_executor import TradeExecutor
 from app.engines.auto_close_engine.auto_close import AutoCloseEngine
@@ -13,31 +11,23 @@ from app.services.websocket_service import WebSocketService
 
 
 class TradeExecutorService:
-    def __init__(self, broker_client, model, db_session):
+    def __init__(self, broker_client, model, session_factory=None):
         self.broker_client = broker_client
         self.model = model
-        self.db_session = db_session
 
         self.risk_manager = RiskManager()
-        self.trade_logger = TradeLogger(db_session)
+        self.trade_logger = TradeLogger(session_factory)
         self.auto_close_engine = AutoCloseEngine(broker_client)
 
-    async def safe_broker_call(self, method: str, *args, retries: int = 5, **kwargs):
+    async def start(self):
+        await self.trade_logger.start()
+
+    async def safe_broker_call(self, method: str, *args, **kwargs):
         """
-        Handles rate limits (HTTP 429) and retries broker API calls.
+        Calls a broker API method. Rate limits are paced by RateLimiter, and a 429 gets
+        one limiter-paced retry inside the client, so failures are raised, not retried here.
         """
-        for attempt in range(retries):
-            try:
-                return await getattr(self.broker_client, method)(*args, **kwargs)
-            except httpx.HTTPStatusError as e:
-                if e.response.status_code == 429:
-                    await asyncio.sleep(2 ** attempt)
-                else:
-                    raise
-            except Exception as e:
-                if attempt == retries - 1:
-                    raise
-                await asyncio.sleep(2 ** attempt)
+        return await getattr(self.broker_client, method)(*args, **kwargs)
 
     async def execute_manual_trade(
         self,
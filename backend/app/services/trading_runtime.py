@@ -0,0 +1,79 @@
+# backend/app/services/trading_runtime.py
+
+import logging
+from typing import Dict
+
+from app.services.market_data_hub import market_data_hub as default_market_data_hub
+from app.utils.bar_store import bar_store as default_bar_store
+from app.utils.broker_clients.broker_manager import BrokerManager
+
+
+def configured_brokers() -> Dict[str, dict]:
+    """
+    Credentials for every broker fully configured through settings/env.
+    """
+    from app.core.config import settings
+
+    candidates = {
+        "binance": {"api_key": settings.BINANCE_API_KEY, "api_secret": settings.BINANCE_API_SECRET},
+        "kraken": {"api_key": settings.KRAKEN_API_KEY, "api_secret": settings.KRAKEN_API_SECRET},
+        "bitfinex": {"api_key": settings.BITFINEX_API_KEY, "api_secret": settings.BITFINEX_API_SECRET},
+        "etrade": {
+            "api_key": settings.ETRADE_API_KEY,
+            "api_secret": settings.ETRADE_API_SECRET,
+            "oauth_token": settings.ETRADE_OAUTH_TOKEN,
+            "oauth_token_secret": settings.ETRADE_OAUTH_SECRET,
+        },
+        "interactivebrokers": {
+            "api_key": settings.INTERACTIVE_BROKERS_KEY,
+            "account_id": settings.INTERACTIVE_BROKERS_ACCOUNT,
+        },
+    }
+    return {broker: creds for broker, creds in candidates.items() if all(creds.values())}
+
+
+def supports_streaming(client) -> bool:
+    return all(hasattr(client, attr) for attr in (
+        "WS_MARKET_URI", "ws_subscribe_messages", "ws_unsubscribe_messages", "parse_ws_ticker"
+    ))
+
+
+class TradingRuntime:
+    """
+    Broker market data started with the app: every configured broker client that can
+    stream is registered with the MarketDataHub, and the shared bar store is built from
+    its quotes. TradeExecutor and AutoCloseEngine read those bars; closer loops attach to
+    the hub themselves (TradeCloserLoop.attach_market_data) where trades are managed.
+    """
+
+    def __init__(self, market_data_hub=None, bar_store=None):
+        self.market_data_hub = market_data_hub or default_market_data_hub
+        self.bar_store = bar_store or default_bar_store
+        self.clients: Dict[str, object] = {}
+
+    def add_broker(self, broker_id: str, client) -> bool:
+        """
+        Stream the client's quotes through the hub. Returns False for clients without websocket support.
+        """
+        if not supports_streaming(client):
+            logging.info(f"[TradingRuntime] {broker_id} has no market data stream; REST polling only")
+            return False
+        self.market_data_hub.add_broker(broker_id, client)
+        self.clients[broker_id] = client
+        return True
+
+    async def start(self):
+        # Streamed quotes build the bars TradeExecutor and AutoCloseEngine read
+        self.bar_store.attach_market_data(self.market_data_hub)
+        for broker_id, credentials in configured_brokers().items():
+            try:
+                self.add_broker(broker_id, BrokerManager.create_client(broker_id, credentials))
+            except Exception as e:
+                logging.error(f"[TradingRuntime] Could not start {broker_id}: {e}")
+        await self.market_data_hub.start()
+
+    async def stop(self):
+        await self.market_data_hub.stop()
+
+
+trading_runtime = TradingRuntime()
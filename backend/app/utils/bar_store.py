@@ -0,0 +1,131 @@
+# backend/app/utils/bar_store.py
+
+from typing import Dict, Optional
+
+import numpy as np
+
+BAR_DTYPE = np.dtype([
+    ("timestamp", "f8"),
+    ("open", "f8"),
+    ("high", "f8"),
+    ("low", "f8"),
+    ("close", "f8"),
+    ("volume", "f8"),
+])
+
+
+class BarSeries:
+    """
+    Fixed-capacity OHLCV ring buffer for one symbol.
+
+    Every bar is written twice, at slot i and i + capacity, so the most recent n bars
+    are always one contiguous slice and window() can return a view instead of a copy.
+    Views alias the buffer: read them right away and copy anything you need to keep.
+    """
+
+    def __init__(self, capacity: int = 500):
+        self.capacity = capacity
+        self.data = np.zeros(capacity * 2, dtype=BAR_DTYPE)
+        self.count = 0
+
+    def append(self, timestamp, open_, high, low, close, volume=0.0):
+        pos = self.count % self.capacity
+        bar = (timestamp, open_, high, low, close, volume)
+        self.data[pos] = bar
+        self.data[pos + self.capacity] = bar
+        self.count += 1
+
+    def update_last(self, high=None, low=None, close=None, volume=None, add_volume=None):
+        """
+        Amend the in-progress bar (e.g. from streamed ticks). `volume` replaces the bar's
+        volume; `add_volume` adds to it.
+        """
+        if not self.count:
+            raise IndexError("No bars to update")
+        pos = (self.count - 1) % self.capacity
+        for idx in (pos, pos + self.capacity):
+            bar = self.data[idx]
+            if high is not None:
+                bar["high"] = max(bar["high"], high)
+            if low is not None:
+                bar["low"] = min(bar["low"], low)
+            if close is not None:
+                bar["close"] = close
+            if volume is not None:
+                bar["volume"] = volume
+            if add_volume is not None:
+                bar["volume"] += add_volume
+
+    def window(self, n: Optional[int] = None) -> np.ndarray:
+        """
+        Zero-copy view of the last n bars (all retained bars if n is None), oldest first.
+        """
+        size = len(self)
+        n = size if n is None else min(n, size)
+        end = self.count % self.capacity + self.capacity
+        return self.data[end - n:end]
+
+    def highs(self, n: Optional[int] = None) -> np.ndarray:
+        return self.window(n)["high"]
+
+    def lows(self, n: Optional[int] = None) -> np.ndarray:
+        return self.window(n)["low"]
+
+    def closes(self, n: Optional[int] = None) -> np.ndarray:
+        return self.window(n)["close"]
+
+    def __len__(self):
+        return min(self.count, self.capacity)
+
+
+class BarStore:
+    """
+    Per-symbol BarSeries registry with bounded memory per symbol.
+    Attached to a MarketDataHub, it builds bar_interval-second bars from streamed quotes.
+    """
+
+    def __init__(self, capacity: int = 500, bar_interval: float = 60.0):
+        self.capacity = capacity
+        self.bar_interval = bar_interval
+        self.series: Dict[str, BarSeries] = {}
+
+    def append(self, symbol: str, timestamp, open_, high, low, close, volume=0.0):
+        series = self.series.get(symbol)
+        if series is None:
+            series = self.series[symbol] = BarSeries(self.capacity)
+        series.append(timestamp, open_, high, low, close, volume)
+
+    def attach_market_data(self, market_data_hub):
+        market_data_hub.subscribe(self.on_quote)
+
+    async def on_quote(self, quote):
+        # Ticker quotes carry no traded size, so bars built from the hub have zero volume
+        self.add_tick(quote.symbol, quote.price, quote.timestamp)
+
+    def add_tick(self, symbol: str, price: float, timestamp: float, size: float = 0.0):
+        """
+        Fold a trade/quote price (and traded size, if known) into the symbol's current
+        bar, opening a new bar when the tick falls in a later interval.
+        """
+        bar_start = timestamp - timestamp % self.bar_interval
+        series = self.series.get(symbol)
+        if series is not None and series.count and series.window(1)["timestamp"][0] >= bar_start:
+            series.update_last(high=price, low=price, close=price, add_volume=size)
+        else:
+            self.append(symbol, bar_start, price, price, price, price, volume=size)
+
+    def get(self, symbol: str) -> Optional[BarSeries]:
+        return self.series.get(symbol)
+
+    def window(self, symbol: str, n: Optional[int] = None) -> Optional[np.ndarray]:
+        series = self.series.get(symbol)
+        return series.window(n) if series else None
+
+    def drop(self, symbol: str):
+        self.series.pop(symbol, None)
+
+    def __contains__(self, symbol: str):
+        return symbol in self.series and len(self.series[symbol]) > 0
+
+
+bar_store = BarStore()
@@ -1,6 +1,8 @@
 # backend/utils/broker_clients/__init__.py
 
 from .broker_manager import BrokerManager
+from .http_pool import HTTPClientPool
+from .rate_limiter import RateLimiter
 from .base_evm_wallet_client import BaseEVMWalletClient
 from .metamask_client import MetaMaskClient
 from .trust_wallet_client import TrustWalletClient
@@ -18,6 +20,8 @@ from .tastytrade_client import TastyTradeClient
 
 __all__ = [
     "BrokerManager",
+    "HTTPClientPool",
+    "RateLimiter",
     "BaseEVMWalletClient",
     "MetaMaskClient",
     "TrustWalletClient",
@@ -1,8 +1,9 @@
-import httpx
 import hmac
 import hashlib
 import time
+import json
 from urllib.parse import urlencode
+from app.utils.broker_clients.http_pool import HTTPClientPool
 
 class BinanceClient:
     BASE_URL = "https://api.binance.com"
@@ -63,7 +64,7 @@ class BinanceClient:
 
         headers = {"X-MBX-APIKEY": self.api_key}
 
-        async with httpx.AsyncClient() as client:
+        async with HTTPClientPool.session("binance") as client:
             response = await client.get(f"{self.BASE_URL}{endpoint}?{signed_params}", headers=headers)
 
         if response.status_code != 200:
@@ -103,5 +104,18 @@ class BinanceClient:
             "margin_percent": margin_percent
         }
 
+    async def get_prices(self, symbols):
+        """
+        Fetch last prices for several symbols (e.g. BTCUSDT) with one ticker/price call.
+        """
+        params = {"symbols": json.dumps(list(symbols), separators=(",", ":"))}
+        async with HTTPClientPool.session("binance") as client:
+            response = await client.get(f"{self.BASE_URL}/api/v3/ticker/price", params=params)
+
+        if response.status_code != 200:
+            raise Exception(f"Failed to fetch Binance tickers: {response.text}")
+
+        return {item["symbol"]: float(item["price"]) for item in response.json()}
+
     def disconnect(self):
         self.logged_in = False
@@ -1,19 +1,20 @@
-import httpx
 import hmac
 import hashlib
 import time
 import json
-import asyncio
 import websockets
+from app.utils.broker_clients.http_pool import HTTPClientPool
 
 class BitfinexClient:
     BASE_URL = "https://api.bitfinex.com"
+    WS_MARKET_URI = "wss://api-pub.bitfinex.com/ws/2"
 
     def __init__(self, api_key: str, api_secret: str, test_mode: bool = False):
         self.api_key = api_key
         self.api_secret = api_secret.encode()
         self.logged_in = False
         self.test_mode = test_mode
+        self.ws_channels = {}  # Ticker chanId -> symbol
 
     async def login(self):
         try:
@@ -66,7 +67,7 @@ class BitfinexClient:
             "Content-Type": "application/json"
         }
 
-        async with httpx.AsyncClient() as client:
+        async with HTTPClientPool.session("bitfinex") as client:
             response = await self._safe_request(client, "POST", url, headers=headers, json=body)
 
         if response.status_code != 200:
@@ -90,16 +91,57 @@ class BitfinexClient:
             "margin_percent": margin_percent
         }
 
-    async def ws_market_updates(self):
-        uri = "wss://api-pub.bitfinex.com/ws/2"
-        async with websockets.connect(uri) as ws:
-            subscribe = {
-                "event": "subscribe",
-                "channel": "ticker",
-                "symbol": "tBTCUSD"
-            }
+    async def get_prices(self, symbols):
+        """
+        Fetch last prices for several symbols (e.g. tBTCUSD) with one public tickers call.
+        """
+        url = f"{self.BASE_URL}/v2/tickers"
+        async with HTTPClientPool.session("bitfinex") as client:
+            response = await self._safe_request(client, "GET", url, params={"symbols": ",".join(symbols)})
+
+        if response.status_code != 200:
+            raise Exception(f"Failed to fetch Bitfinex tickers: {response.text}")
+
+        # Ticker rows: [SYMBOL, BID, BID_SIZE, ASK, ASK_SIZE, DAILY_CHANGE, DAILY_CHANGE_RELATIVE, LAST_PRICE, ...]
+        return {row[0]: float(row[7]) for row in response.json()}
+
+    def ws_subscribe_messages(self, symbols):
+        return [{"event": "subscribe", "channel": "ticker", "symbol": symbol} for symbol in symbols]
+
+    def ws_unsubscribe_messages(self, symbols):
+        symbols = set(symbols)
+        return [
+            {"event": "unsubscribe", "chanId": chan_id}
+            for chan_id, symbol in self.ws_channels.items() if symbol in symbols
+        ]
+
+    def parse_ws_ticker(self, message):
+        """
+        Returns (symbol, last, bid, ask) for a ticker update, or None for events/heartbeats.
+        Channel IDs are mapped to symbols from the "subscribed" events.
+        """
+        if isinstance(message, dict):
+            if message.get("event") == "subscribed" and message.get("channel") == "ticker":
+                self.ws_channels[message["chanId"]] = message["symbol"]
+            elif message.get("event") == "unsubscribed":
+                self.ws_channels.pop(message.get("chanId"), None)
+            return None
+
+        if not isinstance(message, list) or len(message) < 2 or not isinstance(message[1], list):
+            return None  # Heartbeat: [chanId, "hb"]
+
+        symbol = self.ws_channels.get(message[0])
+        if symbol is None:
+            return None
+        # [BID, BID_SIZE, ASK, ASK_SIZE, DAILY_CHANGE, DAILY_CHANGE_RELATIVE, LAST_PRICE, ...]
+        ticker = message[1]
+        return symbol, float(ticker[6]), float(ticker[0]), float(ticker[2])
+
+    async def ws_market_updates(self, symbols=("tBTCUSD",)):
+        async with websockets.connect(self.WS_MARKET_URI) as ws:
             print("Subscribing to ticker...")
-            await ws.send(json.dumps(subscribe))
+            for subscribe in self.ws_subscribe_messages(symbols):
+                await ws.send(json.dumps(subscribe))
             async for message in ws:
                 data = json.loads(message)
                 print("Market Update:", data)
@@ -122,17 +164,11 @@ class BitfinexClient:
                 print("Trade Execution Update:", data)
 
     async def _safe_request(self, client, method, url, **kwargs):
-        retries = 5
-        backoff = 1
-        for attempt in range(retries):
+        response = await client.request(method, url, **kwargs)
+        if response.status_code == 429:
+            # RateLimiter now holds this endpoint class for Retry-After; the retry waits there
             response = await client.request(method, url, **kwargs)
-            if response.status_code == 429:
-                retry_after = int(response.headers.get("Retry-After", backoff))
-                await asyncio.sleep(retry_after)
-                backoff *= 2
-            else:
-                return response
-        raise Exception(f"Rate limit exceeded after {retries} retries.")
+        return response
 
     async def disconnect(self):
         self.logged_in = False
@@ -1,9 +1,9 @@
-import httpx
 import hmac
 import hashlib
 import time
 import asyncio
 import json
+from app.utils.broker_clients.http_pool import HTTPClientPool
 
 class CoinbaseClient:
     BASE_URL = "https://api.coinbase.com/v2"
@@ -35,7 +35,7 @@ class CoinbaseClient:
             "CB-ACCESS-SIGN": self._generate_signature("GET", "/accounts", "")[1]
         }
 
-        async with httpx.AsyncClient() as client:
+        async with HTTPClientPool.session("coinbase") as client:
             response = await client.get(f"{self.BASE_URL}/accounts", headers=headers)
 
         if response.status_code != 200:
@@ -73,7 +73,7 @@ class CoinbaseClient:
             "CB-ACCESS-SIGN": self._generate_signature("GET", "/accounts", "")[1]
         }
 
-        async with httpx.AsyncClient() as client:
+        async with HTTPClientPool.session("coinbase") as client:
             response = await client.get(f"{self.BASE_URL}/accounts", headers=headers)
 
         if response.status_code != 200:
@@ -110,7 +110,7 @@ class CoinbaseClient:
             "CB-ACCESS-SIGN": self._generate_signature("GET", "/accounts", "")[1]
         }
 
-        async with httpx.AsyncClient() as client:
+        async with HTTPClientPool.session("coinbase") as client:
             response = await client.get(f"{self.BASE_URL}/accounts", headers=headers)
 
         if response.status_code != 200:
@@ -1,6 +1,6 @@
-import httpx
 import time
 from requests_oauthlib import OAuth1
+from app.utils.broker_clients.http_pool import HTTPClientPool
 
 class ETradeClient:
     BASE_URL = "https://api.etrade.com/v1"
@@ -47,7 +47,7 @@ class ETradeClient:
         Fetch account balances from E*TRADE API.
         """
         url = f"{self.BASE_URL}/accounts/list.json"
-        async with httpx.AsyncClient() as client:
+        async with HTTPClientPool.session("etrade") as client:
             response = await client.get(url, auth=self._oauth_headers())
 
         if response.status_code != 200:
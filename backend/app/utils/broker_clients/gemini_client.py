@@ -1,9 +1,9 @@
-import httpx
 import hmac
 import hashlib
 import base64
 import json
 import time
+from app.utils.broker_clients.http_pool import HTTPClientPool
 
 class GeminiClient:
     BASE_URL = "https://api.gemini.com"
@@ -66,7 +66,7 @@ class GeminiClient:
             "X-GEMINI-SIGNATURE": signature
         }
 
-        async with httpx.AsyncClient() as client:
+        async with HTTPClientPool.session("gemini") as client:
             response = await client.post(url, headers=headers)
 
         if response.status_code != 200:
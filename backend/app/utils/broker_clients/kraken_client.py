@@ -1,21 +1,30 @@
-import httpx
 import hmac
 import hashlib
 import time
 import base64
 from urllib.parse import urlencode
-import asyncio
 import websockets
 import json
+from app.utils.broker_clients.http_pool import HTTPClientPool
+
+def _pair_alias(name: str) -> str:
+    """
+    Separator- and case-insensitive pair name with Kraken's XBT/XDG asset codes spelled BTC/DOGE.
+    """
+    name = name.upper().replace("/", "").replace("-", "").replace("_", "")
+    return name.replace("XBT", "BTC").replace("XDG", "DOGE")
+
 
 class KrakenClient:
     BASE_URL = "https://api.kraken.com"
+    WS_MARKET_URI = "wss://ws.kraken.com"
 
     def __init__(self, api_key: str, api_secret: str, test_mode: bool = False):
         self.api_key = api_key
         self.api_secret = api_secret.encode()
         self.logged_in = False
         self.test_mode = test_mode
+        self.pair_keys = None  # _pair_alias(key | altname | wsname) -> Kraken pair key, loaded once
 
     def _nonce(self):
         return int(time.time() * 1000)
@@ -45,17 +54,11 @@ class KrakenClient:
         return sigdigest.decode()
 
     async def _safe_request(self, client, method, url, **kwargs):
-        retries = 5
-        backoff = 1
-        for attempt in range(retries):
+        response = await client.request(method, url, **kwargs)
+        if response.status_code == 429:
+            # RateLimiter now holds this endpoint class for Retry-After; the retry waits there
             response = await client.request(method, url, **kwargs)
-            if response.status_code == 429:
-                retry_after = int(response.headers.get("Retry-After", backoff))
-                await asyncio.sleep(retry_after)
-                backoff *= 2
-            else:
-                return response
-        raise Exception(f"Rate limit exceeded after {retries} retries.")
+        return response
 
     async def get_account_info(self):
         if self.test_mode:
@@ -70,7 +73,7 @@ class KrakenClient:
                 "margin_percent": 25.0
             }
 
-        async with httpx.AsyncClient() as client:
+        async with HTTPClientPool.session("kraken") as client:
             url_path = "/0/private/Balance"
             url = f"{self.BASE_URL}{url_path}"
             data = {"nonce": self._nonce()}
@@ -113,16 +116,79 @@ class KrakenClient:
             "margin_percent": margin_percent
         }
 
-    async def ws_market_trade_updates(self):
-        uri = "wss://ws.kraken.com"
-        async with websockets.connect(uri) as ws:
-            subscribe = {
-                "event": "subscribe",
-                "pair": ["BTC/USD"],
-                "subscription": {"name": "ticker"}
-            }
+    async def get_prices(self, symbols):
+        """
+        Fetch last trade prices for several pairs with one public Ticker call.
+        Keyed by the requested symbols (Kraken answers with its own pair keys, e.g.
+        XXBTZUSD for XBT/USD); symbols Kraken does not list are simply absent.
+        """
+        async with HTTPClientPool.session("kraken") as client:
+            pair_keys = await self._load_pair_keys(client)
+            requested = {}
+            for symbol in symbols:
+                key = pair_keys.get(_pair_alias(symbol))
+                if key:
+                    requested.setdefault(key, []).append(symbol)
+            if not requested:
+                return {}
+
+            url = f"{self.BASE_URL}/0/public/Ticker"
+            response = await self._safe_request(client, "GET", url, params={"pair": ",".join(requested)})
+
+        if response.status_code != 200:
+            raise Exception(f"Failed to fetch Kraken tickers: {response.text}")
+
+        prices = {}
+        for key, ticker in response.json().get("result", {}).items():
+            for symbol in requested.get(key, ()):
+                prices[symbol] = float(ticker["c"][0])
+        return prices
+
+    async def _load_pair_keys(self, client):
+        """
+        Map every spelling of each tradable pair to its Ticker result key (one AssetPairs call, cached).
+        """
+        if self.pair_keys is None:
+            response = await self._safe_request(client, "GET", f"{self.BASE_URL}/0/public/AssetPairs")
+            if response.status_code != 200:
+                raise Exception(f"Failed to fetch Kraken asset pairs: {response.text}")
+            pair_keys = {}
+            for key, info in response.json().get("result", {}).items():
+                for name in (key, info.get("altname"), info.get("wsname")):
+                    if name:
+                        pair_keys.setdefault(_pair_alias(name), key)
+            self.pair_keys = pair_keys
+        return self.pair_keys
+
+    def ws_subscribe_messages(self, symbols):
+        return [{
+            "event": "subscribe",
+            "pair": list(symbols),
+            "subscription": {"name": "ticker"}
+        }]
+
+    def ws_unsubscribe_messages(self, symbols):
+        return [{
+            "event": "unsubscribe",
+            "pair": list(symbols),
+            "subscription": {"name": "ticker"}
+        }]
+
+    def parse_ws_ticker(self, message):
+        """
+        Returns (symbol, last, bid, ask) for a ticker message, or None for events/heartbeats.
+        Ticker frames look like [channelID, {"a": [...], "b": [...], "c": [...]}, "ticker", "XBT/USD"].
+        """
+        if not isinstance(message, list) or len(message) < 4 or message[2] != "ticker":
+            return None
+        ticker = message[1]
+        return message[3], float(ticker["c"][0]), float(ticker["b"][0]), float(ticker["a"][0])
+
+    async def ws_market_trade_updates(self, symbols=("BTC/USD",)):
+        async with websockets.connect(self.WS_MARKET_URI) as ws:
             print("Subscribing to Kraken market updates...")
-            await ws.send(json.dumps(subscribe))
+            for subscribe in self.ws_subscribe_messages(symbols):
+                await ws.send(json.dumps(subscribe))
             async for message in ws:
                 data = json.loads(message)
                 print("Market Update:", data)
@@ -150,7 +216,7 @@ class KrakenClient:
             "API-Sign": self._sign(url_path, data)
         }
 
-        async with httpx.AsyncClient() as client:
+        async with HTTPClientPool.session("kraken") as client:
             response = await self._safe_request(client, "POST", url, data=data, headers=headers)
 
         if response.status_code != 200:
@@ -0,0 +1,182 @@
+# backend/app/utils/broker_clients/rate_limiter.py
+
+import asyncio
+import time
+from typing import Dict, Tuple
+
+import httpx
+
+
+class TokenBucket:
+    """
+    Classic token bucket: `rate` tokens per second refill up to `capacity`.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self, cost: float = 1):
+        async with self.lock:
+            while True:
+                self._refill()
+                if self.tokens >= cost:
+                    self.tokens -= cost
+                    return
+                await asyncio.sleep((cost - self.tokens) / self.rate)
+
+    def sync_used(self, used: float):
+        """
+        Align with a server-reported usage figure (e.g. Binance X-MBX-USED-WEIGHT-1M).
+        """
+        self._refill()
+        self.tokens = min(self.tokens, max(0.0, self.capacity - used))
+
+    def hold(self, seconds: float):
+        """
+        Grant nothing for `seconds` (a server Retry-After): the bucket goes that much refill into debt.
+        """
+        self._refill()
+        self.tokens = min(self.tokens, 0.0) - seconds * self.rate
+
+
+class DecayingCounter:
+    """
+    Kraken-style limiter: each call adds to a counter that decays at `decay` per second;
+    a call may proceed only while the counter stays at or below `max_count`.
+    """
+
+    def __init__(self, max_count: float, decay: float):
+        self.max_count = max_count
+        self.decay = decay
+        self.count = 0.0
+        self.updated = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    def _decay(self):
+        now = time.monotonic()
+        self.count = max(0.0, self.count - (now - self.updated) * self.decay)
+        self.updated = now
+
+    async def acquire(self, cost: float = 1):
+        async with self.lock:
+            while True:
+                self._decay()
+                if self.count + cost <= self.max_count:
+                    self.count += cost
+                    return
+                await asyncio.sleep((self.count + cost - self.max_count) / self.decay)
+
+    def sync_used(self, used: float):
+        self._decay()
+        self.count = max(self.count, used)
+
+    def hold(self, seconds: float):
+        self._decay()
+        self.count = max(self.count, self.max_count) + seconds * self.decay
+
+
+class RateLimiter:
+    """
+    Proactive per-broker, per-endpoint-class limiter. Pooled HTTP clients call
+    before_request/after_response through httpx event hooks, so requests wait for
+    budget instead of hitting a 429 and backing off. A 429 that still gets through
+    holds its endpoint class for the server's Retry-After, so the next request (the
+    client's single retry included) waits here rather than in a local sleep loop.
+    """
+
+    # broker -> endpoint class -> (kind, rate_or_max, capacity_or_decay)
+    BROKER_LIMITS: Dict[str, Dict[str, Tuple[str, float, float]]] = {
+        "kraken": {
+            "private": ("decay", 15, 0.33),    # Starter tier: max 15, decays 0.33/s
+            "public": ("bucket", 1.0, 1),
+        },
+        "binance": {
+            "default": ("bucket", 20.0, 1200),  # 1200 request weight per minute
+        },
+        "bitfinex": {
+            "default": ("bucket", 1.5, 90),     # 90 requests per minute
+        },
+        "coinbase": {
+            "default": ("bucket", 10.0, 10),
+        },
+        "gemini": {
+            "default": ("bucket", 5.0, 10),
+        },
+        "robinhood": {
+            "default": ("bucket", 2.0, 5),
+        },
+        "default": {
+            "default": ("bucket", 5.0, 10),
+        },
+    }
+
+    # Kraken history endpoints cost 2 counter points instead of 1
+    KRAKEN_HEAVY_ENDPOINTS = ("Ledgers", "QueryLedgers", "TradesHistory", "QueryTrades")
+
+    # Binance request weights for the endpoints we call (default weight is 1)
+    BINANCE_WEIGHTS = {
+        "/api/v3/account": 20,
+        "/sapi/v1/margin/account": 10,
+        "/api/v3/ticker/price": 4,
+    }
+
+    _limiters: Dict[Tuple[str, str], object] = {}
+
+    @classmethod
+    def get(cls, broker: str, endpoint_class: str = "default"):
+        key = (broker, endpoint_class)
+        if key not in cls._limiters:
+            limits = cls.BROKER_LIMITS.get(broker, cls.BROKER_LIMITS["default"])
+            kind, first, second = limits.get(endpoint_class) or limits.get("default") or cls.BROKER_LIMITS["default"]["default"]
+            cls._limiters[key] = DecayingCounter(first, second) if kind == "decay" else TokenBucket(first, second)
+        return cls._limiters[key]
+
+    @classmethod
+    def classify(cls, broker: str, url: httpx.URL) -> Tuple[str, float]:
+        """
+        Map a request URL to (endpoint class, cost) for the broker.
+        """
+        path = url.path
+        if broker == "kraken":
+            if "/private/" in path:
+                cost = 2 if path.rsplit("/", 1)[-1] in cls.KRAKEN_HEAVY_ENDPOINTS else 1
+                return "private", cost
+            return "public", 1
+        if broker == "binance":
+            return "default", cls.BINANCE_WEIGHTS.get(path, 1)
+        return "default", 1
+
+    @classmethod
+    async def acquire(cls, broker: str, endpoint_class: str = "default", cost: float = 1):
+        await cls.get(broker, endpoint_class).acquire(cost)
+
+    @classmethod
+    async def before_request(cls, broker: str, request: httpx.Request):
+        endpoint_class, cost = cls.classify(broker, request.url)
+        await cls.acquire(broker, endpoint_class, cost)
+
+    @staticmethod
+    def retry_after(response: httpx.Response, default: float = 1.0) -> float:
+        try:
+            return max(0.0, float(response.headers.get("Retry-After", default)))
+        except ValueError:  # HTTP-date form
+            return default
+
+    @classmethod
+    async def after_response(cls, broker: str, response: httpx.Response):
+        if response.status_code == 429:
+            endpoint_class, _ = cls.classify(broker, response.request.url)
+            cls.get(broker, endpoint_class).hold(cls.retry_after(response))
+        if broker == "binance":
+            used = response.headers.get("X-MBX-USED-WEIGHT-1M")
+            if used is not None:
+                cls.get(broker, "default").sync_used(float(used))
@@ -1,10 +1,10 @@
-import httpx
-import asyncio
 import websockets
 import json
+from app.utils.broker_clients.http_pool import HTTPClientPool
 
 class RobinhoodClient:
     BASE_URL = "https://api.robinhood.com"
+    WS_MARKET_URI = "wss://api.robinhood.com/market"
 
     def __init__(self, username: str, password: str, test_mode: bool = False):
         self.username = username
@@ -20,7 +20,7 @@ class RobinhoodClient:
 
         login_payload = {"username": self.username, "password": self.password}
 
-        async with httpx.AsyncClient() as client:
+        async with HTTPClientPool.session("robinhood") as client:
             response = await client.post(f"{self.BASE_URL}/oauth2/token/", data=login_payload)
 
         if response.status_code != 200:
@@ -35,17 +35,11 @@ class RobinhoodClient:
         return self.logged_in
 
     async def _safe_request(self, client, method, url, **kwargs):
-        retries = 5
-        backoff = 1
-        for attempt in range(retries):
+        response = await client.request(method, url, **kwargs)
+        if response.status_code == 429:
+            # RateLimiter now holds this endpoint class for Retry-After; the retry waits there
             response = await client.request(method, url, **kwargs)
-            if response.status_code == 429:
-                retry_after = int(response.headers.get("Retry-After", backoff))
-                await asyncio.sleep(retry_after)
-                backoff *= 2
-            else:
-                return response
-        raise Exception(f"Rate limit exceeded after {retries} retries.")
+        return response
 
     async def get_account_info(self):
         if self.test_mode:
@@ -62,8 +56,10 @@ class RobinhoodClient:
 
         headers = {"Authorization": f"Bearer {self.auth_token}"}
 
-        async with httpx.AsyncClient() as client:
+        async with HTTPClientPool.session("robinhood") as client:
             response = await self._safe_request(client, "GET", f"{self.BASE_URL}/accounts/", headers=headers)
+            if response.status_code != 200:
+                raise Exception(f"Failed to fetch Robinhood account: {response.text}")
 
         profile_data = response.json()["results"][0]
         account_id = profile_data.get("account_number")
@@ -93,8 +89,10 @@ class RobinhoodClient:
 
         headers = {"Authorization": f"Bearer {self.auth_token}"}
 
-        async with httpx.AsyncClient() as client:
+        async with HTTPClientPool.session("robinhood") as client:
             response = await self._safe_request(client, "GET", f"{self.BASE_URL}/crypto/accounts/", headers=headers)
+            if response.status_code != 200:
+                raise Exception(f"Failed to fetch Robinhood crypto account: {response.text}")
 
         data = response.json()["results"][0]
         return {
@@ -103,11 +101,30 @@ class RobinhoodClient:
             "available_crypto": float(data.get("cash_available_for_withdrawal", 0.0))
         }
 
-    async def ws_market_updates(self):
-        uri = "wss://api.robinhood.com/market"
-        async with websockets.connect(uri) as ws:
-            subscribe = {"event": "subscribe", "channel": "ticker", "symbol": "BTC/USD"}
-            await ws.send(json.dumps(subscribe))
+    def ws_subscribe_messages(self, symbols):
+        return [{"event": "subscribe", "channel": "ticker", "symbol": symbol} for symbol in symbols]
+
+    def ws_unsubscribe_messages(self, symbols):
+        return [{"event": "unsubscribe", "channel": "ticker", "symbol": symbol} for symbol in symbols]
+
+    def parse_ws_ticker(self, message):
+        """
+        Returns (symbol, last, bid, ask) for a ticker message, or None for anything else.
+        """
+        if not isinstance(message, dict) or message.get("channel") != "ticker" or "price" not in message:
+            return None
+        price = float(message["price"])
+        return (
+            message["symbol"],
+            price,
+            float(message.get("bid_price", price)),
+            float(message.get("ask_price", price)),
+        )
+
+    async def ws_market_updates(self, symbols=("BTC/USD",)):
+        async with websockets.connect(self.WS_MARKET_URI) as ws:
+            for subscribe in self.ws_subscribe_messages(symbols):
+                await ws.send(json.dumps(subscribe))
             async for message in ws:
                 data = json.loads(message)
                 print("Market Update:", data)
@@ -1,4 +1,4 @@
-import httpx
+from app.utils.broker_clients.http_pool import HTTPClientPool
 
 class SchwabClient:
     BASE_URL = "https://api.schwabapi.com/v1"
@@ -28,7 +28,7 @@ class SchwabClient:
             "client_secret": self.client_secret
         }
 
-        async with httpx.AsyncClient() as client:
+        async with HTTPClientPool.session("schwab") as client:
             response = await client.post(self.AUTH_URL, data=payload)
 
         if response.status_code != 200:
@@ -66,7 +66,7 @@ class SchwabClient:
 
         url = f"{self.BASE_URL}/accounts"
 
-        async with httpx.AsyncClient() as client:
+        async with HTTPClientPool.session("schwab") as client:
             response = await client.get(url, headers=self._auth_headers())
 
         if response.status_code != 200:
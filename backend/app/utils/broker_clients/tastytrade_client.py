@@ -1,6 +1,6 @@
-import httpx
 import time
 import asyncio
+from app.utils.broker_clients.http_pool import HTTPClientPool
 
 class TastyTradeClient:
     BASE_URL = "https://api.tastyworks.com"
@@ -23,7 +23,7 @@ class TastyTradeClient:
             "password": self.password
         }
 
-        async with httpx.AsyncClient() as client:
+        async with HTTPClientPool.session("tastytrade") as client:
             response = await client.post(f"{self.BASE_URL}/sessions", json=login_payload)
 
         if response.status_code != 200:
@@ -60,7 +60,7 @@ class TastyTradeClient:
             "Authorization": f"Bearer {self.session_token}"
         }
 
-        async with httpx.AsyncClient() as client:
+        async with HTTPClientPool.session("tastytrade") as client:
             accounts_response = await client.get(f"{self.BASE_URL}/accounts", headers=headers)
 
         if accounts_response.status_code != 200:
@@ -74,7 +74,7 @@ class TastyTradeClient:
         self.account_number = account["account-number"]
 
         balances_url = f"{self.BASE_URL}/accounts/{self.account_number}/balances"
-        async with httpx.AsyncClient() as client:
+        async with HTTPClientPool.session("tastytrade") as client:
             balance_response = await client.get(balances_url, headers=headers)
 
         if balance_response.status_code != 200:
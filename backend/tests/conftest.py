@@ -0,0 +1,73 @@
+# backend/tests/conftest.py
+
+import numpy as np
+import pytest
+
+from app.models.model_registry import ModelRegistry
+from app.services.inference_service import InferenceService
+
+
+class CountingEstimator:
+    """
+    predict_proba stand-in that counts its calls and scored rows.
+    """
+
+    def __init__(self):
+        self.calls = 0
+        self.rows = 0
+
+    def predict_proba(self, X):
+        self.calls += 1
+        self.rows += len(X)
+        X = np.asarray(X, dtype=float)
+        positive = 1 / (1 + np.exp(-X.sum(axis=1)))
+        return np.column_stack([1 - positive, positive])
+
+
+class _Wrapper:
+    def __init__(self, model):
+        self.model = model
+
+
+class _StaticLoader:
+    def __init__(self, wrapper, path, digest=None):
+        self.wrapper = wrapper
+        self.path = path
+        self.digest = digest
+
+    def load(self):
+        return self.wrapper
+
+    def content_hash(self):
+        return self.digest
+
+    def estimated_size(self, instance=None):
+        return 0
+
+
+@pytest.fixture
+def estimator():
+    return CountingEstimator()
+
+
+@pytest.fixture
+def make_service(tmp_path):
+    """
+    Factory for an InferenceService over a fresh ModelRegistry whose only model, "Fake",
+    wraps the given estimator. Any process pool a test enables is shut down afterwards.
+    """
+    services = []
+
+    def make(estimator, digest=None, **kwargs):
+        model_file = tmp_path / "fake.joblib"
+        model_file.write_bytes(b"model")
+        registry = ModelRegistry(compile_trees=False)
+        loader = _StaticLoader(_Wrapper(estimator), str(model_file), digest)
+        registry.registry["Fake"] = {"type": "crypto", "loader": loader, "performance": {}}
+        service = InferenceService(registry, **kwargs)
+        services.append(service)
+        return service
+
+    yield make
+    for service in services:
+        service.registry.shutdown_process_pool()
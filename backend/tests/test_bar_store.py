@@ -0,0 +1,23 @@
+# backend/tests/test_bar_store.py
+
+from app.utils.bar_store import BarStore
+
+
+def test_ticks_build_ohlcv_bars_per_interval():
+    store = BarStore(bar_interval=60.0)
+    for timestamp, price, size in ((0.0, 10.0, 1.0), (10.0, 12.0, 2.0), (20.0, 9.0, 0.5), (59.0, 11.0, 1.5),
+                                   (60.0, 11.5, 3.0)):
+        store.add_tick("BTC", price, timestamp, size)
+
+    first, second = store.window("BTC")
+    assert (first["timestamp"], first["open"], first["high"], first["low"], first["close"]) == (0.0, 10.0, 12.0, 9.0, 11.0)
+    assert first["volume"] == 5.0
+    assert (second["timestamp"], second["open"], second["close"], second["volume"]) == (60.0, 11.5, 11.5, 3.0)
+
+
+def test_ticks_without_size_leave_volume_at_zero():
+    store = BarStore()
+    store.add_tick("BTC", 10.0, 0.0)
+    store.add_tick("BTC", 11.0, 1.0)
+
+    assert store.window("BTC")["volume"][-1] == 0.0
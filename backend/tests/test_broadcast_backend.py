@@ -0,0 +1,39 @@
+# backend/tests/test_broadcast_backend.py
+
+import asyncio
+
+import pytest
+
+from app.services.broadcast_backend import BroadcastBus
+from app.services.fanout import Fanout
+
+
+class _RecordingFanout(Fanout):
+    def __init__(self, name):
+        super().__init__(name)
+        self.published = []
+
+    def publish(self, message, channel=None):
+        self.published.append((message, channel))
+        return 1
+
+
+def test_channels_round_trip_through_the_backend_unchanged():
+    fanout = _RecordingFanout("prices")
+    bus = BroadcastBus()
+    bus.register(fanout)
+
+    async def publish_all():
+        await bus.start()
+        for channel in (0, None, "", "kraken"):
+            await bus.publish(fanout, {"p": 1}, channel)
+
+    asyncio.run(publish_all())
+
+    assert [channel for _, channel in fanout.published] == [0, None, "", "kraken"]
+
+
+def test_non_scalar_channels_are_rejected():
+    bus = BroadcastBus()
+    with pytest.raises(TypeError):
+        asyncio.run(bus.publish(_RecordingFanout("prices"), {}, ("kraken", "BTC")))
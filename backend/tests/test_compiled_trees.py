@@ -0,0 +1,40 @@
+# backend/tests/test_compiled_trees.py
+
+import numpy as np
+from sklearn.ensemble import GradientBoostingClassifier, RandomForestClassifier
+
+from app.models.compiled_trees import _float32_at_or_below, compile_estimator, verify
+
+
+def _data(seed=0):
+    rng = np.random.default_rng(seed)
+    X = rng.normal(size=(400, 6))
+    y = (X[:, 0] + X[:, 1] * X[:, 2] > 0).astype(int)
+    return X, y
+
+
+def test_compiled_models_verify_and_match_predict_proba():
+    X, y = _data()
+    for estimator in (
+        RandomForestClassifier(n_estimators=20, random_state=0).fit(X, y),
+        GradientBoostingClassifier(n_estimators=20, random_state=0).fit(X, y),
+    ):
+        compiled = compile_estimator(estimator)
+        assert verify(compiled, estimator)
+        X_new = _data(seed=1)[0].astype(np.float32)
+        assert np.array_equal(compiled.predict_proba(X_new), estimator.predict_proba(X_new))
+
+
+def test_verify_rejects_a_split_moved_by_one_float32_step():
+    X, y = _data()
+    estimator = RandomForestClassifier(n_estimators=20, random_state=0).fit(X, y)
+    compiled = compile_estimator(estimator)
+
+    # Deep inside the last tree, so a sampled check would be unlikely to notice
+    node = int(compiled.roots[-1]) + estimator.estimators_[-1].tree_.node_count // 2
+    while compiled.left[node] == node:
+        node -= 1
+    at_or_below = _float32_at_or_below(compiled.threshold[node])
+    compiled.threshold[node] = np.nextafter(at_or_below, np.float32(np.inf))
+
+    assert not verify(compiled, estimator)
@@ -0,0 +1,66 @@
+# backend/tests/test_forecast_engine.py
+
+import numpy as np
+
+from app.engines.forecast_engine.forecast_engine import ForecastEngine
+from app.utils.bar_store import BarSeries
+
+
+def _series(n, capacity=100, seed=0):
+    rng = np.random.default_rng(seed)
+    series = BarSeries(capacity)
+    close = 100.0
+    for t in range(n):
+        close += rng.normal()
+        series.append(t * 60.0, close, close + abs(rng.normal()), close - abs(rng.normal()), close)
+    return series
+
+
+class _CountingForecastEngine(ForecastEngine):
+    def __init__(self):
+        super().__init__({"mode": "easy"})
+        self.seeds = 0
+        self.updates = 0
+
+    def seed_symbol(self, *args):
+        self.seeds += 1
+        return super().seed_symbol(*args)
+
+    def update_bar(self, *args, **kwargs):
+        self.updates += 1
+        return super().update_bar(*args, **kwargs)
+
+
+def test_forecast_series_seeds_once_then_folds_each_closed_bar():
+    engine = _CountingForecastEngine()
+    series = _series(40)
+
+    engine.forecast_series("BTC", series)
+    for t in range(40, 45):
+        series.append(t * 60.0, 100.0, 101.0, 99.0, 100.5)
+        forecast = engine.forecast_series("BTC", series)
+    engine.forecast_series("BTC", series)  # No new closed bar: nothing to fold
+
+    assert engine.seeds == 1
+    assert engine.updates == 5
+
+    # Same result as seeding on the first 39 closed bars and folding the next five by hand
+    reference = ForecastEngine({"mode": "easy"})
+    bars = series.window()
+    reference.seed_symbol("BTC", bars["high"][:39], bars["low"][:39], bars["close"][:39])
+    for bar in bars[39:44]:
+        expected = reference.update_bar("BTC", bar["high"], bar["low"], bar["close"])
+    assert forecast == expected
+
+
+def test_forecast_series_reseeds_a_replaced_series():
+    engine = ForecastEngine({"mode": "easy"})
+    engine.forecast_series("BTC", _series(40))
+    replacement = _series(60, seed=1)
+
+    forecast = engine.forecast_series("BTC", replacement)
+
+    bars = replacement.window()[:-1]
+    reference = ForecastEngine({"mode": "easy"})
+    reference.seed_symbol("BTC", bars["high"], bars["low"], bars["close"])
+    assert forecast["atr"] == reference.get_symbol_atr("BTC")
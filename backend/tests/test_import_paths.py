@@ -0,0 +1,19 @@
+# backend/tests/test_import_paths.py
+
+import os
+import subprocess
+import sys
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_engines_import_without_the_db_or_core_packages():
+    # Fresh interpreter: app.db / app.core pull in a circular import and the discovery engine
+    code = (
+        "import sys\n"
+        "import app.engines.auto_close_engine, app.engines.execution_engine.trade_executor\n"
+        "loaded = [m for m in sys.modules if m.startswith(('app.db', 'app.core'))]\n"
+        "assert not loaded, loaded\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], cwd=BACKEND_DIR, capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
@@ -0,0 +1,94 @@
+# backend/tests/test_inference_service.py
+
+import asyncio
+from concurrent.futures import Executor, Future
+from concurrent.futures.process import BrokenProcessPool
+
+import numpy as np
+
+
+class _BrokenPool(Executor):
+    def submit(self, fn, *args, **kwargs):
+        future = Future()
+        future.set_exception(BrokenProcessPool("worker died"))
+        return future
+
+
+class _FailingEstimator:
+    def predict_proba(self, X):
+        raise ValueError("bad features")
+
+
+def test_concurrent_predicts_share_one_predict_proba_call(estimator, make_service):
+    service = make_service(estimator, max_delay=0.01)
+    rows = [[i * 0.01, 1.0] for i in range(50)]
+
+    async def score():
+        return await asyncio.gather(*(service.predict("Fake", row) for row in rows))
+
+    confidences = asyncio.run(score())
+
+    assert estimator.calls == 1
+    assert estimator.rows == len(rows)
+    expected = estimator.predict_proba(rows)[:, 1]
+    assert np.allclose(confidences, expected)
+
+
+def test_failed_batch_raises_for_every_caller(make_service):
+    service = make_service(_FailingEstimator())
+
+    async def score():
+        return await asyncio.gather(
+            *(service.predict("Fake", [float(i), 1.0]) for i in range(3)), return_exceptions=True
+        )
+
+    results = asyncio.run(score())
+
+    assert all(isinstance(result, ValueError) for result in results)
+    assert not service.cache.entries
+
+
+def test_broken_process_pool_is_replaced_and_the_batch_scored_inline(estimator, make_service):
+    service = make_service(estimator)
+    broken = service.registry.process_pool = _BrokenPool()
+    service.registry.process_workers = 1
+
+    confidence = asyncio.run(service.predict("Fake", [0.0, 0.0]))
+
+    assert confidence == 0.5
+    assert estimator.calls == 1
+    assert service.registry.process_pool is not broken
+
+
+def test_repeated_features_are_served_from_the_cache(estimator, make_service):
+    service = make_service(estimator)
+
+    async def score_twice():
+        first = await service.predict("Fake", [0.5, 0.25])
+        second = await service.predict("Fake", [0.5, 0.25])
+        return first, second
+
+    first, second = asyncio.run(score_twice())
+
+    assert first == second
+    assert estimator.calls == 1
+    assert service.cache.stats()["hits"] == 1
+
+
+def test_reloading_changed_model_content_invalidates_its_cached_predictions(estimator, make_service):
+    service = make_service(estimator, digest="v1")
+
+    async def score():
+        return await service.predict("Fake", [0.5, 0.25])
+
+    asyncio.run(score())
+    service.registry.unload("Fake")
+    service.registry.get_model("Fake")  # Same content: cache kept
+    asyncio.run(score())
+    assert estimator.calls == 1
+
+    service.registry.unload("Fake")
+    service.registry.registry["Fake"]["loader"].digest = "v2"
+    service.registry.get_model("Fake")  # Retrained: cache dropped
+    asyncio.run(score())
+    assert estimator.calls == 2
@@ -0,0 +1,41 @@
+# backend/tests/test_kraken_client.py
+
+import asyncio
+
+import httpx
+
+from app.utils.broker_clients.http_pool import HTTPClientPool
+from app.utils.broker_clients.kraken_client import KrakenClient
+
+ASSET_PAIRS = {
+    "XXBTZUSD": {"altname": "XBTUSD", "wsname": "XBT/USD"},
+    "XETHZUSD": {"altname": "ETHUSD", "wsname": "ETH/USD"},
+    "SOLUSD": {"altname": "SOLUSD", "wsname": "SOL/USD"},
+}
+LAST_PRICES = {"XXBTZUSD": "65000.1", "XETHZUSD": "3100.5", "SOLUSD": "150.25"}
+
+
+def test_get_prices_is_keyed_by_the_requested_symbols(monkeypatch):
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        if request.url.path == "/0/public/AssetPairs":
+            return httpx.Response(200, json={"error": [], "result": ASSET_PAIRS})
+        pairs = request.url.params["pair"].split(",")
+        result = {pair: {"c": [LAST_PRICES[pair], "1.0"]} for pair in reversed(pairs)}  # Kraken's order
+        return httpx.Response(200, json={"error": [], "result": result})
+
+    monkeypatch.setitem(HTTPClientPool._clients, "kraken", httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+    client = KrakenClient("key", "c2VjcmV0")
+
+    async def fetch_twice():
+        first = await client.get_prices(["BTC/USD", "ETH-USD", "SOLUSD", "NOPE/USD"])
+        second = await client.get_prices(["XBTUSD"])
+        return first, second
+
+    first, second = asyncio.run(fetch_twice())
+
+    assert first == {"BTC/USD": 65000.1, "ETH-USD": 3100.5, "SOLUSD": 150.25}
+    assert second == {"XBTUSD": 65000.1}
+    assert [r.url.path for r in requests].count("/0/public/AssetPairs") == 1  # Pair names are cached
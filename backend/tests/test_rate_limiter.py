@@ -0,0 +1,54 @@
+# backend/tests/test_rate_limiter.py
+
+import asyncio
+import time
+from functools import partial
+
+import httpx
+
+from app.utils.broker_clients.kraken_client import KrakenClient
+from app.utils.broker_clients.rate_limiter import RateLimiter
+
+
+def test_429_holds_the_limiter_for_retry_after_and_is_retried_once(monkeypatch):
+    monkeypatch.setattr(RateLimiter, "_limiters", {})
+    sent = []
+
+    def handler(request):
+        sent.append(time.monotonic())
+        if len(sent) == 1:
+            return httpx.Response(429, headers={"Retry-After": "0.3"})
+        return httpx.Response(200, json={"result": {}})
+
+    async def request():
+        client = httpx.AsyncClient(
+            transport=httpx.MockTransport(handler),
+            event_hooks={
+                "request": [partial(RateLimiter.before_request, "testbroker")],
+                "response": [partial(RateLimiter.after_response, "testbroker")],
+            },
+        )
+        async with client:
+            return await KrakenClient("key", "c2VjcmV0")._safe_request(client, "GET", "https://example.test/ticker")
+
+    response = asyncio.run(request())
+
+    assert response.status_code == 200
+    assert len(sent) == 2
+    assert sent[1] - sent[0] >= 0.3  # The retry waited in the limiter, not in a client sleep loop
+
+
+def test_a_second_429_is_returned_to_the_caller(monkeypatch):
+    monkeypatch.setattr(RateLimiter, "_limiters", {})
+    sent = []
+
+    def handler(request):
+        sent.append(request)
+        return httpx.Response(429, headers={"Retry-After": "0"})
+
+    async def request():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            return await KrakenClient("key", "c2VjcmV0")._safe_request(client, "GET", "https://example.test/ticker")
+
+    assert asyncio.run(request()).status_code == 429
+    assert len(sent) == 2